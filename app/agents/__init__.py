@@ -2,20 +2,51 @@
 AI Agents for the Agentic AI Swarm system
 """
 
-from .base_agent import BaseAgent
-from .core_brain_agent import CoreBrainAgent
-from .solution_architecture_agent import SolutionArchitectureAgent
-from .technical_architecture_agent import TechnicalArchitectureAgent
-from .security_architecture_agent import SecurityArchitectureAgent
-from .data_architecture_agent import DataArchitectureAgent
-from .integration_architecture_agent import IntegrationArchitectureAgent
-from .infrastructure_architecture_agent import InfrastructureArchitectureAgent
-from .costing_agent import CostingAgent
-from .application_portfolio_agent import ApplicationPortfolioAgent
-from .generic_agent import GenericAgent
+import importlib
+from typing import Any
+
+from .base_agent import AgentConfig, BaseAgent, StaticValidationAgent, ValidationRuleSpec, ValidationSpec
+
+# Concrete agents are imported on first attribute access (PEP 562) so a process
+# only loads the agent modules it actually uses
+_LAZY_IMPORTS = {
+    "AgentSpec": "template_agent",
+    "TemplateAgent": "template_agent",
+    "CoreBrainAgent": "core_brain_agent",
+    "SolutionArchitectureAgent": "solution_architecture_agent",
+    "TechnicalArchitectureAgent": "technical_architecture_agent",
+    "SecurityArchitectureAgent": "security_architecture_agent",
+    "DataArchitectureAgent": "template_agent",
+    "IntegrationArchitectureAgent": "integration_architecture_agent",
+    "InfrastructureArchitectureAgent": "template_agent",
+    "CostingAgent": "template_agent",
+    "ApplicationPortfolioAgent": "application_portfolio_agent",
+    "GenericAgent": "template_agent",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
+    "AgentConfig",
     "BaseAgent",
+    "StaticValidationAgent",
+    "ValidationRuleSpec",
+    "ValidationSpec",
+    "AgentSpec",
+    "TemplateAgent",
     "CoreBrainAgent",
     "SolutionArchitectureAgent",
     "TechnicalArchitectureAgent",
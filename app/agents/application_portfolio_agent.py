@@ -1,62 +1,40 @@
-from typing import Dict, Any
 """
 Application Portfolio Agent - Application lifecycle management
 """
 
-from app.agents.base_agent import BaseAgent
-from app.models.agents import AgentType, AgentStatus, AgentTask
-from app.models.governance import ValidationResult, ValidationStatus, ValidationSeverity
+from app.agents.base_agent import AgentConfig, StaticValidationAgent, ValidationRuleSpec, ValidationSpec
+from app.models.agents import AgentType
 
 
-class ApplicationPortfolioAgent(BaseAgent):
+class ApplicationPortfolioAgent(StaticValidationAgent):
     """Application Portfolio Agent for application lifecycle management"""
     
-    def __init__(self):
-        super().__init__(
-            agent_type=AgentType.APPLICATION_PORTFOLIO,
-            name="Application Portfolio Agent",
-            description="Manages application portfolio and lifecycle"
-        )
-    
-    async def _initialize_agent(self) -> None:
-        self.logger.info("Initializing Application Portfolio Agent")
+    __slots__ = ()
     
-    async def _load_configuration(self) -> None:
-        self.config = {
-            "validation_rules": ["portfolio_management", "lifecycle", "rationalization"],
-            "compliance_frameworks": ["TOGAF", "ITIL"]
-        }
+    CONFIG = AgentConfig(
+        validation_rules=("portfolio_management", "lifecycle", "rationalization"),
+        compliance_frameworks=("TOGAF", "ITIL")
+    )
     
-    async def _perform_health_check(self) -> bool:
-        return True
-    
-    async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
-        try:
-            validation_results = []
-            
-            portfolio_result = self.create_validation_result(
+    VALIDATION_SPEC = ValidationSpec(
+        rules=(
+            ValidationRuleSpec(
                 rule_id="PORT_001",
                 rule_name="Portfolio Management",
                 rule_description="Validates application portfolio management",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
                 message="Portfolio management is effective",
-                recommendations=["Continue portfolio monitoring"]
-            )
-            validation_results.append(portfolio_result)
-            
-            return {
-                "status": "completed",
-                "agent_id": self.agent_id,
-                "validation_results": [result.dict() for result in validation_results],
-                "risk_score": 18.0,
-                "compliance_score": 86.0,
-                "recommendations": ["Monitor application lifecycle", "Optimize portfolio"],
-                "domain": "application_portfolio"
-            }
-        except Exception as e:
-            self.logger.error(f"Task processing failed: {e}")
-            raise
+                recommendations=("Continue portfolio monitoring",)
+            ),
+        ),
+        risk_score=18.0,
+        compliance_score=86.0,
+        recommendations=("Monitor application lifecycle", "Optimize portfolio"),
+        domain="application_portfolio"
+    )
     
-    async def _cleanup(self) -> None:
-        self.logger.info("Application Portfolio Agent cleanup complete")
+    def __init__(self):
+        super().__init__(
+            agent_type=AgentType.APPLICATION_PORTFOLIO,
+            name="Application Portfolio Agent",
+            description="Manages application portfolio and lifecycle"
+        )
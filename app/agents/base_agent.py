@@ -3,15 +3,31 @@ Base Agent class for the Agentic AI Swarm system
 """
 
 import asyncio
+import functools
+import inspect
 import logging
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
-from uuid import uuid4
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import ClassVar, Deque, Dict, Any, Iterable, List, Mapping, Optional, Tuple, Union
+from uuid import UUID
 
-from app.config import settings
-from app.models.agents import Agent, AgentStatus, AgentType, AgentTask
-from app.models.governance import ValidationResult, ValidationStatus, ValidationSeverity, GovernanceScope
+import orjson
+from pydantic import BaseModel as PydanticBaseModel
+
+from app.config import get_settings
+from app.models.base import now_batched, random_bytes, sortable_uuid, utc_now
+from app.models.agents import AgentStatus, AgentType, AgentTask
+from app.models.governance import (
+    VALIDATION_RESULT_LIST_ADAPTER,
+    ValidationResult,
+    ValidationStatus,
+    ValidationSeverity,
+    GovernanceScope
+)
 
 # Map AgentType values to matching GovernanceScope values
 _AGENT_TYPE_TO_SCOPE = {
@@ -27,65 +43,228 @@ _AGENT_TYPE_TO_SCOPE = {
     AgentType.GENERIC: GovernanceScope.COMPREHENSIVE,
 }
 
+# Status members bound once at module scope for the per-task state transitions
+_STATUS_IDLE = AgentStatus.IDLE
+_STATUS_BUSY = AgentStatus.BUSY
+_STATUS_ERROR = AgentStatus.ERROR
+_STATUS_OFFLINE = AgentStatus.OFFLINE
+_STATUS_INITIALIZING = AgentStatus.INITIALIZING
+
+
+@functools.lru_cache(maxsize=1)
+def _llm_selection() -> Tuple[str, str]:
+    """Resolve the LLM provider and model once from settings; they are shared by all agents"""
+    provider = "openai" if get_settings().openai_api_key else "anthropic"
+    return provider, "gpt-4" if provider == "openai" else "claude-3-sonnet"
+
+
+def _next_agent_id() -> str:
+    """Return a random UUID4 string drawn from the shared entropy buffer"""
+    return str(UUID(bytes=random_bytes(16), version=4))
+
+
+# Loggers are cached per agent name so construction skips the logging manager lock
+_AGENT_LOGGERS: Dict[str, logging.Logger] = {}
+
+
+def _get_agent_logger(name: str) -> logging.Logger:
+    """Return the shared logger for agents with the given name"""
+    logger = _AGENT_LOGGERS.get(name)
+    if logger is None:
+        logger = _AGENT_LOGGERS[name] = logging.getLogger(f"agent.{name}")
+    return logger
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize objects orjson does not handle natively"""
+    if isinstance(obj, PydanticBaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_task_result(result: Dict[str, Any]) -> bytes:
+    """Serialize a task result dict to JSON bytes"""
+    return orjson.dumps(result, default=_json_default)
+
+
+def dump_validation_results(results: List[ValidationResult]) -> List[Dict[str, Any]]:
+    """Serialize validation results to plain dicts for a task result"""
+    return VALIDATION_RESULT_LIST_ADAPTER.dump_python(results)
+
+
+# Identity fields every response must mint afresh rather than share from a static result
+_PER_RESPONSE_FIELDS = ("id", "created_at", "updated_at")
+
+
+def freeze_validation_results(results: List[ValidationResult]) -> Tuple[Mapping[str, Any], ...]:
+    """Serialize static validation results once to read-only JSON-ready mappings shared across tasks
+    
+    The id and timestamps are left out; stamp_validation_results() adds fresh ones per response.
+    """
+    frozen = []
+    for result in VALIDATION_RESULT_LIST_ADAPTER.dump_python(results, mode="json"):
+        for name in _PER_RESPONSE_FIELDS:
+            del result[name]
+        frozen.append(MappingProxyType(result))
+    return tuple(frozen)
+
+
+def stamp_validation_results(results: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy frozen validation results for one response, giving each a new id and the response's timestamp"""
+    now = utc_now()
+    return [
+        {"id": sortable_uuid(), "created_at": now, "updated_at": now, **result}
+        for result in results
+    ]
+
+
+def _cancel_futures(entries: Iterable[Tuple[AgentTask, Optional[asyncio.Future]]]) -> None:
+    """Cancel the unresolved futures of queued (task, future) pairs"""
+    for _, future in entries:
+        if future is not None and not future.done():
+            future.cancel()
+
+
+async def _resolve(value: Any) -> Any:
+    """Await value if a lifecycle hook returned an awaitable, so hooks may be sync or async"""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class AgentConfig:
+    """Static validation configuration shared by every instance of an agent type"""
+    validation_rules: Tuple[str, ...] = ()
+    compliance_frameworks: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationRuleSpec:
+    """A passing validation rule reported by an agent whose checks are static"""
+    rule_id: str
+    rule_name: str
+    rule_description: str
+    message: str
+    recommendations: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationSpec:
+    """Static task outcome of an agent: its validation rules and the scores reported with them"""
+    rules: Tuple[ValidationRuleSpec, ...]
+    risk_score: float
+    compliance_score: float
+    recommendations: Tuple[str, ...]
+    domain: str
+
 
 class BaseAgent(ABC):
     """Base class for all AI agents in the swarm"""
     
+    __slots__ = (
+        "agent_id",
+        "agent_type",
+        "name",
+        "description",
+        "status",
+        "logger",
+        "total_requests",
+        "successful_requests",
+        "failed_requests",
+        "_total_response_time_ns",
+        "last_activity",
+        "config",
+        "llm_provider",
+        "model_name",
+        "error_count",
+        "last_error",
+        "_recent_errors",
+        "current_task",
+        "task_queue",
+        "_queue_worker",
+        "_status_template",
+    )
+    
+    # Subclasses whose _process_task never awaits may implement it as a plain
+    # method; SYNC is derived per class so tasks skip the coroutine round-trip
+    SYNC = False
+    
+    # Agents whose health check is a constant set this to skip awaiting it
+    HEALTH_STATIC: Optional[bool] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.SYNC = not inspect.iscoroutinefunction(cls._process_task)
+    
     def __init__(self, agent_type: AgentType, name: str, description: str):
-        self.agent_id = str(uuid4())
+        self.agent_id = _next_agent_id()
         self.agent_type = agent_type
         self.name = name
         self.description = description
-        self.status = AgentStatus.INITIALIZING
-        self.logger = logging.getLogger(f"agent.{self.name}")
+        self.status = _STATUS_INITIALIZING
+        self.logger = _get_agent_logger(self.name)
         
         # Performance tracking
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
-        self.average_response_time = 0.0
+        self._total_response_time_ns = 0
         self.last_activity = None
         
         # Configuration
         self.config = {}
-        self.llm_provider = settings.openai_api_key and "openai" or "anthropic"
-        self.model_name = "gpt-4" if self.llm_provider == "openai" else "claude-3-sonnet"
+        self.llm_provider, self.model_name = _llm_selection()
         
         # Health monitoring
-        self.health_score = 100.0
         self.error_count = 0
         self.last_error = None
+        self._recent_errors: Deque[str] = deque(maxlen=16)
         
         # Task management
         self.current_task: Optional[AgentTask] = None
-        self.task_queue: List[AgentTask] = []
+        self.task_queue: Deque[Tuple[AgentTask, Optional[asyncio.Future]]] = deque(maxlen=get_settings().agent_task_queue_max)
+        self._queue_worker: Optional[asyncio.Task] = None
         
-        self.logger.info(f"Initializing {self.name} agent ({self.agent_type})")
+        # Identity fields never change, so get_status() starts from a copy of them
+        self._status_template = {
+            "agent_id": self.agent_id,
+            "name": self.name,
+            "agent_type": self.agent_type
+        }
+        
+        self.logger.info("Initializing %s agent (%s)", self.name, self.agent_type)
     
     async def initialize(self) -> bool:
         """Initialize the agent"""
         try:
-            self.status = AgentStatus.INITIALIZING
-            self.logger.info(f"Initializing {self.name} agent")
+            self.status = _STATUS_INITIALIZING
+            self.logger.info("Initializing %s agent", self.name)
             
             # Initialize agent-specific components
-            await self._initialize_agent()
+            await _resolve(self._initialize_agent())
             
             # Load configuration
-            await self._load_configuration()
+            await _resolve(self._load_configuration())
             
             # Perform health check
-            health_check = await self._perform_health_check()
+            health_check = (
+                self.HEALTH_STATIC if self.HEALTH_STATIC is not None
+                else await _resolve(self._perform_health_check())
+            )
             if not health_check:
                 raise Exception("Health check failed")
             
-            self.status = AgentStatus.IDLE
-            self.logger.info(f"{self.name} agent initialized successfully")
+            self.status = _STATUS_IDLE
+            self.logger.info("%s agent initialized successfully", self.name)
             return True
             
         except Exception as e:
-            self.status = AgentStatus.ERROR
+            self.status = _STATUS_ERROR
             self.last_error = str(e)
+            self._recent_errors.append(self.last_error)
             self.error_count += 1
             self.logger.error(f"Failed to initialize {self.name} agent: {e}")
             return False
@@ -107,59 +286,133 @@ class BaseAgent(ABC):
     
     async def process_task(self, task: AgentTask) -> Dict[str, Any]:
         """Process a task assigned to this agent"""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         
         try:
-            self.status = AgentStatus.BUSY
+            self.status = _STATUS_BUSY
             self.current_task = task
             self.total_requests += 1
-            self.last_activity = datetime.utcnow()
+            now = datetime.now(timezone.utc)
+            self.last_activity = now
             
-            self.logger.info(f"Processing task {task.task_id} for {self.name}")
+            self.logger.info("Processing task %s for %s", task.task_id, self.name)
             
             # Update task status
             task.status = "in_progress"
-            task.started_at = datetime.utcnow()
+            task.started_at = now
             
             # Process the task
-            result = await self._process_task(task)
+            result = self._process_task(task) if self.SYNC else await self._process_task(task)
             
             # Update task completion
             task.status = "completed"
-            task.completed_at = datetime.utcnow()
+            task.completed_at = datetime.now(timezone.utc)
             task.result = result
             
             # Update performance metrics
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
-            self._update_performance_metrics(processing_time, True)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            self._update_performance_metrics(elapsed_ns, True)
             
-            self.status = AgentStatus.IDLE
+            self.status = _STATUS_IDLE
             self.current_task = None
             
-            self.logger.info(f"Task {task.task_id} completed successfully in {processing_time:.2f}s")
+            self.logger.info("Task %s completed successfully in %.2fs", task.task_id, elapsed_ns / 1e9)
             return result
             
         except Exception as e:
             # Update error metrics
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
-            self._update_performance_metrics(processing_time, False)
+            self._update_performance_metrics(time.perf_counter_ns() - start_ns, False)
+            error_message = str(e)
             self.error_count += 1
-            self.last_error = str(e)
+            self.last_error = error_message
+            self._recent_errors.append(error_message)
             
             # Update task status
             if self.current_task:
                 self.current_task.status = "failed"
-                self.current_task.error_message = str(e)
-                self.current_task.completed_at = datetime.utcnow()
+                self.current_task.error_message = error_message
+                self.current_task.completed_at = datetime.now(timezone.utc)
             
-            self.status = AgentStatus.ERROR
-            self.logger.error(f"Task {task.task_id} failed: {e}")
+            self.status = _STATUS_ERROR
+            self.logger.error(f"Task {task.task_id} failed: {error_message}")
             
             # Attempt recovery
             await self._attempt_recovery()
             
             raise
     
+    async def submit_task(self, task: AgentTask) -> str:
+        """Queue a task for background processing and return its ID immediately"""
+        self._enqueue(task, None)
+        return task.task_id
+    
+    async def run_queued_task(self, task: AgentTask) -> Dict[str, Any]:
+        """Queue a task behind any pending work on this agent and wait for its result"""
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(task, future)
+        return await future
+    
+    def _enqueue(self, task: AgentTask, future: Optional[asyncio.Future]) -> None:
+        """Append a task to the FIFO queue, starting the queue worker if needed"""
+        if len(self.task_queue) >= self.task_queue.maxlen:
+            raise Exception(f"Task queue for {self.name} is full")
+        
+        task.status = "queued"
+        self.task_queue.append((task, future))
+        
+        # Start a queue worker if one is not already draining the queue
+        if self._queue_worker is None or self._queue_worker.done():
+            self._queue_worker = asyncio.create_task(self._drain_task_queue())
+    
+    async def _drain_task_queue(self) -> None:
+        """Process queued tasks in FIFO order, handing them to process_batch in batches"""
+        batch_size = get_settings().batch_size
+        batch: List[Tuple[AgentTask, Optional[asyncio.Future]]] = []
+        try:
+            while self.task_queue:
+                batch = []
+                while self.task_queue and len(batch) < batch_size:
+                    task, future = self.task_queue.popleft()
+                    if future is not None and future.cancelled():
+                        continue
+                    batch.append((task, future))
+                if not batch:
+                    continue
+                
+                # Failure details are recorded on each task by process_task
+                try:
+                    results = await self.process_batch([task for task, _ in batch])
+                except Exception as e:
+                    self.logger.error(f"Batch processing failed for {self.name}: {e}")
+                    results = [e] * len(batch)
+                
+                for (_, future), result in zip(batch, results):
+                    if future is None or future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                batch = []
+        finally:
+            # Only reached with work outstanding if this worker was cancelled; the queue
+            # is left alone if shutdown() already detached this worker from the agent
+            _cancel_futures(batch)
+            if self._queue_worker is asyncio.current_task():
+                self._queue_worker = None
+                _cancel_futures(self.task_queue)
+                self.task_queue.clear()
+    
+    async def process_batch(self, tasks: List[AgentTask]) -> List[Union[Dict[str, Any], Exception]]:
+        """Process several tasks in one call, returning each task's result or the exception it raised"""
+        results: List[Union[Dict[str, Any], Exception]] = []
+        for task in tasks:
+            try:
+                results.append(await self.process_task(task))
+            except Exception as e:
+                results.append(e)
+        return results
+    
     @abstractmethod
     async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
         """Process a specific task - to be implemented by subclasses"""
@@ -168,71 +421,88 @@ class BaseAgent(ABC):
     async def _attempt_recovery(self) -> bool:
         """Attempt to recover from errors"""
         try:
-            self.logger.info(f"Attempting recovery for {self.name}")
+            self.logger.info("Attempting recovery for %s", self.name)
             
             # Perform health check
-            if await self._perform_health_check():
-                self.status = AgentStatus.IDLE
-                self.logger.info(f"Recovery successful for {self.name}")
+            health_check = (
+                self.HEALTH_STATIC if self.HEALTH_STATIC is not None
+                else await _resolve(self._perform_health_check())
+            )
+            if health_check:
+                self.status = _STATUS_IDLE
+                self.logger.info("Recovery successful for %s", self.name)
                 return True
             else:
-                self.logger.warning(f"Recovery failed for {self.name}")
+                self.logger.warning("Recovery failed for %s", self.name)
                 return False
                 
         except Exception as e:
             self.logger.error(f"Recovery attempt failed for {self.name}: {e}")
             return False
     
-    def _update_performance_metrics(self, response_time: float, success: bool) -> None:
+    def _update_performance_metrics(self, response_time_ns: int, success: bool) -> None:
         """Update agent performance metrics"""
         if success:
             self.successful_requests += 1
         else:
             self.failed_requests += 1
         
-        # Update average response time
-        if self.total_requests > 0:
-            self.average_response_time = (
-                (self.average_response_time * (self.total_requests - 1) + response_time) 
-                / self.total_requests
-            )
-        
-        # Update health score
+        self._total_response_time_ns += response_time_ns
+    
+    @property
+    def average_response_time(self) -> float:
+        """Average response time in seconds"""
+        if not self.total_requests:
+            return 0.0
+        return self._total_response_time_ns / self.total_requests / 1e9
+    
+    @property
+    def health_score(self) -> float:
+        """Agent health score (0-100) derived from success rate and error count"""
+        if not self.total_requests:
+            return 100.0
         success_rate = (self.successful_requests / self.total_requests) * 100
-        self.health_score = min(100.0, success_rate - (self.error_count * 5))
+        return min(100.0, success_rate - (self.error_count * 5))
     
     async def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
-        return {
-            "agent_id": self.agent_id,
-            "name": self.name,
-            "agent_type": self.agent_type,
-            "status": self.status,
-            "health_score": self.health_score,
-            "total_requests": self.total_requests,
-            "successful_requests": self.successful_requests,
-            "failed_requests": self.failed_requests,
-            "average_response_time": self.average_response_time,
-            "error_count": self.error_count,
-            "last_error": self.last_error,
-            "last_activity": self.last_activity,
-            "current_task": self.current_task.task_id if self.current_task else None,
-            "queue_length": len(self.task_queue)
-        }
+        status = self._status_template.copy()
+        status.update(
+            status=self.status,
+            health_score=self.health_score,
+            total_requests=self.total_requests,
+            successful_requests=self.successful_requests,
+            failed_requests=self.failed_requests,
+            average_response_time=self.average_response_time,
+            error_count=self.error_count,
+            last_error=self.last_error,
+            recent_errors=list(self._recent_errors),
+            last_activity=self.last_activity,
+            current_task=self.current_task.task_id if self.current_task else None,
+            queue_length=len(self.task_queue)
+        )
+        return status
     
     async def shutdown(self) -> None:
         """Shutdown the agent gracefully"""
         try:
             self.logger.info(f"Shutting down {self.name} agent")
-            self.status = AgentStatus.OFFLINE
+            self.status = _STATUS_OFFLINE
             
             # Complete current task if any
             if self.current_task:
                 self.logger.warning(f"Completing current task {self.current_task.task_id}")
                 # Handle task completion based on agent type
             
+            # Stop the queue worker and cancel queued tasks so callers awaiting them don't hang
+            worker, self._queue_worker = self._queue_worker, None
+            if worker is not None and not worker.done():
+                worker.cancel()
+            _cancel_futures(self.task_queue)
+            self.task_queue.clear()
+            
             # Cleanup agent-specific resources
-            await self._cleanup()
+            await _resolve(self._cleanup())
             
             self.logger.info(f"{self.name} agent shutdown complete")
             
@@ -244,12 +514,12 @@ class BaseAgent(ABC):
         try:
             self.logger.info(f"Starting {self.name} agent")
             
-            if self.status == AgentStatus.OFFLINE:
+            if self.status == _STATUS_OFFLINE:
                 # Re-initialize if agent was shut down
                 return await self.initialize()
-            elif self.status == AgentStatus.IDLE:
+            elif self.status == _STATUS_IDLE:
                 # Agent is already idle, just mark as active
-                self.status = AgentStatus.IDLE
+                self.status = _STATUS_IDLE
                 self.logger.info(f"{self.name} agent started successfully")
                 return True
             else:
@@ -266,13 +536,13 @@ class BaseAgent(ABC):
         try:
             self.logger.info(f"Stopping {self.name} agent")
             
-            if self.status == AgentStatus.BUSY:
+            if self.status == _STATUS_BUSY:
                 # Wait for current task to complete or timeout
                 if self.current_task:
                     self.logger.warning(f"Waiting for current task {self.current_task.task_id} to complete")
                     # In a real implementation, you might want to implement task cancellation
                     
-            self.status = AgentStatus.IDLE
+            self.status = _STATUS_IDLE
             self.logger.info(f"{self.name} agent stopped successfully")
             return True
             
@@ -307,6 +577,48 @@ class BaseAgent(ABC):
         """Agent-specific cleanup"""
         pass
     
+    def _build_response(
+        self,
+        validation_results: Any,
+        risk_score: float,
+        compliance_score: float,
+        recommendations: Any,
+        domain: str
+    ) -> Dict[str, Any]:
+        """Build a completed task result in the shape shared by all specialized agents"""
+        return {
+            "status": "completed",
+            "agent_id": self.agent_id,
+            "validation_results": validation_results,
+            "risk_score": risk_score,
+            "compliance_score": compliance_score,
+            "recommendations": recommendations,
+            "domain": domain
+        }
+    
+    def _build_static_response(self, spec: ValidationSpec) -> Dict[str, Any]:
+        """Build the task result for a ValidationSpec, whose outcome never depends on the task"""
+        with now_batched():
+            validation_results = freeze_validation_results([
+                self.create_validation_result(
+                    rule_id=rule.rule_id,
+                    rule_name=rule.rule_name,
+                    rule_description=rule.rule_description,
+                    severity=ValidationSeverity.INFO,
+                    status=ValidationStatus.PASSED,
+                    message=rule.message,
+                    recommendations=list(rule.recommendations)
+                )
+                for rule in spec.rules
+            ])
+        return self._build_response(
+            validation_results=validation_results,
+            risk_score=spec.risk_score,
+            compliance_score=spec.compliance_score,
+            recommendations=spec.recommendations,
+            domain=spec.domain
+        )
+    
     def create_validation_result(
         self,
         rule_id: str,
@@ -317,20 +629,26 @@ class BaseAgent(ABC):
         message: str,
         details: Optional[Dict[str, Any]] = None,
         recommendations: Optional[List[str]] = None,
-        compliance_frameworks: Optional[List[str]] = None
+        compliance_frameworks: Optional[List[str]] = None,
+        validated: bool = False
     ) -> ValidationResult:
-        """Create a validation result"""
-        return ValidationResult(
+        """Create a validation result
+        
+        Agents build results from their own trusted values, so validation is
+        skipped by default; pass ``validated=True`` for externally sourced input.
+        """
+        factory = ValidationResult if validated else ValidationResult.construct_trusted
+        return factory(
             rule_id=rule_id,
             rule_name=rule_name,
             rule_description=rule_description,
-            severity=severity,
-            status=status,
+            severity=ValidationSeverity(severity).value,
+            status=ValidationStatus(status).value,
             message=message,
             details=details or {},
             recommendations=recommendations or [],
             compliance_frameworks=compliance_frameworks or [],
-            domain=_AGENT_TYPE_TO_SCOPE.get(self.agent_type, GovernanceScope.COMPREHENSIVE)
+            domain=_AGENT_TYPE_TO_SCOPE.get(self.agent_type, GovernanceScope.COMPREHENSIVE).value
         )
     
     async def communicate_with_agent(self, target_agent_id: str, message: Dict[str, Any]) -> Dict[str, Any]:
@@ -340,5 +658,39 @@ class BaseAgent(ABC):
         return {
             "status": "message_sent",
             "target_agent": target_agent_id,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
+
+
+class StaticValidationAgent(BaseAgent):
+    """Specialized agent that reports the same VALIDATION_SPEC outcome for every task
+    
+    Subclasses only declare CONFIG and VALIDATION_SPEC; the response is built once
+    when configuration is loaded, and each task gets a copy whose validation results
+    carry their own id and timestamp.
+    """
+    
+    __slots__ = ("_response_template",)
+    
+    HEALTH_STATIC = True
+    
+    CONFIG: ClassVar[AgentConfig] = AgentConfig()
+    VALIDATION_SPEC: ClassVar[ValidationSpec]
+    
+    def _initialize_agent(self) -> None:
+        self.logger.info("Initializing %s", self.name)
+    
+    def _load_configuration(self) -> None:
+        self.config = self.CONFIG
+        self._response_template = self._build_static_response(self.VALIDATION_SPEC)
+    
+    def _perform_health_check(self) -> bool:
+        return True
+    
+    def _process_task(self, task: AgentTask) -> Dict[str, Any]:
+        response = self._response_template.copy()
+        response["validation_results"] = stamp_validation_results(response["validation_results"])
+        return response
+    
+    def _cleanup(self) -> None:
+        self.logger.info("%s cleanup complete", self.name)
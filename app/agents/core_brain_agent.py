@@ -1,31 +1,107 @@
-from typing import Dict, Any
 """
 Core Brain Agent - Orchestrates all specialized agents in the swarm
 """
 
 import asyncio
-import logging
-from datetime import datetime
-from typing import Dict, Any, List, Optional
-from uuid import uuid4
+import functools
+import re
+from collections import Counter
+from contextlib import aclosing
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, List, Tuple
 
 from app.agents.base_agent import BaseAgent
-from app.models.agents import AgentType, AgentStatus, AgentTask
+from app.cache import TTLCache
+from app.models.agents import AGENT_TASK_LIST_ADAPTER, AgentType, AgentTask
 from app.models.governance import (
+    VALIDATION_RESULT_LIST_ADAPTER,
     GovernanceRequest,
     GovernanceResponse,
     ValidationResult,
     ValidationStatus,
-    ValidationSeverity,
     GovernanceScope
 )
 from pydantic import ValidationError
-from app.config import settings
+from app.config import get_settings
+
+# Validation status members bound once at module scope for result counting and filtering
+_VALIDATION_PASSED = ValidationStatus.PASSED
+_VALIDATION_FAILED = ValidationStatus.FAILED
+_VALIDATION_WARNING = ValidationStatus.WARNING
 
 
 class CoreBrainAgent(BaseAgent):
     """Core Brain Agent that orchestrates all specialized agents"""
     
+    __slots__ = (
+        "specialized_agents",
+        "_target_agents_cache",
+        "_result_cache",
+        "_dispatch_sem",
+        "_dispatch_limit",
+    )
+    
+    # Task routing rules
+    _ROUTING_RULES = MappingProxyType({
+        GovernanceScope.SOLUTION: ("solution_architecture",),
+        GovernanceScope.TECHNICAL: ("technical_architecture",),
+        GovernanceScope.SECURITY: ("security_architecture",),
+        GovernanceScope.DATA: ("data_architecture",),
+        GovernanceScope.INTEGRATION: ("integration_architecture",),
+        GovernanceScope.INFRASTRUCTURE: ("infrastructure_architecture",),
+        GovernanceScope.COSTING: ("costing",),
+        GovernanceScope.APPLICATION_PORTFOLIO: ("application_portfolio",),
+        GovernanceScope.COMPREHENSIVE: (
+            "solution_architecture",
+            "technical_architecture",
+            "security_architecture",
+            "data_architecture",
+            "integration_architecture",
+            "infrastructure_architecture",
+            "costing",
+            "application_portfolio"
+        )
+    })
+    
+    # Governance frameworks and standards
+    _GOVERNANCE_FRAMEWORKS = MappingProxyType({
+        "TOGAF": "The Open Group Architecture Framework",
+        "ISO_42010": "ISO/IEC/IEEE 42010 Systems and software engineering",
+        "AWS_WELL_ARCHITECTED": "AWS Well-Architected Framework",
+        "AZURE_ARCHITECTURE": "Microsoft Azure Architecture Framework",
+        "GCP_ARCHITECTURE": "Google Cloud Architecture Framework",
+        "NIST_CYBERSECURITY": "NIST Cybersecurity Framework",
+        "GDPR": "General Data Protection Regulation",
+        "SOX": "Sarbanes-Oxley Act",
+        "HIPAA": "Health Insurance Portability and Accountability Act"
+    })
+    
+    # Keywords that mark a recommendation as high priority for next steps
+    _HIGH_PRIO_RE = re.compile(r"critical|urgent|immediate|security", re.IGNORECASE)
+    
+    # Validation result count at which response building moves to a worker thread
+    _SYNTHESIS_THREAD_THRESHOLD = 16
+    
+    # Next steps used when no validation failed and no recommendation is high priority
+    _DEFAULT_NEXT_STEPS = (
+        "Review all validation results and recommendations",
+        "Implement recommended improvements",
+        "Schedule follow-up validation"
+    )
+    
+    # Static agent-specific context merged into each subtask's context
+    _AGENT_STATIC_CTX = {
+        "security_architecture": MappingProxyType({
+            "security_frameworks": ("NIST", "ISO_27001", "OWASP"),
+            "threat_modeling_required": True
+        }),
+        "costing": MappingProxyType({
+            "cost_analysis_period": "monthly",
+            "include_operational_costs": True
+        })
+    }
+    
     def __init__(self):
         super().__init__(
             agent_type=AgentType.CORE_BRAIN,
@@ -36,40 +112,19 @@ class CoreBrainAgent(BaseAgent):
         # Agent registry - will be populated by agent manager
         self.specialized_agents: Dict[str, Any] = {}
         
-        # Task routing rules
-        self.routing_rules = {
-            GovernanceScope.SOLUTION: ["solution_architecture"],
-            GovernanceScope.TECHNICAL: ["technical_architecture"],
-            GovernanceScope.SECURITY: ["security_architecture"],
-            GovernanceScope.DATA: ["data_architecture"],
-            GovernanceScope.INTEGRATION: ["integration_architecture"],
-            GovernanceScope.INFRASTRUCTURE: ["infrastructure_architecture"],
-            GovernanceScope.COSTING: ["costing"],
-            GovernanceScope.APPLICATION_PORTFOLIO: ["application_portfolio"],
-            GovernanceScope.COMPREHENSIVE: [
-                "solution_architecture",
-                "technical_architecture", 
-                "security_architecture",
-                "data_architecture",
-                "integration_architecture",
-                "infrastructure_architecture",
-                "costing",
-                "application_portfolio"
-            ]
-        }
+        # Routing resolved per scope to registered (name, agent) pairs, cleared on registration
+        self._target_agents_cache = functools.lru_cache(maxsize=None)(self._resolve_target_agents)
         
-        # Governance frameworks and standards
-        self.governance_frameworks = {
-            "TOGAF": "The Open Group Architecture Framework",
-            "ISO_42010": "ISO/IEC/IEEE 42010 Systems and software engineering",
-            "AWS_WELL_ARCHITECTED": "AWS Well-Architected Framework",
-            "AZURE_ARCHITECTURE": "Microsoft Azure Architecture Framework",
-            "GCP_ARCHITECTURE": "Google Cloud Architecture Framework",
-            "NIST_CYBERSECURITY": "NIST Cybersecurity Framework",
-            "GDPR": "General Data Protection Regulation",
-            "SOX": "Sarbanes-Oxley Act",
-            "HIPAA": "Health Insurance Portability and Accountability Act"
-        }
+        # Recent specialized agent results keyed by agent and request content
+        settings = get_settings()
+        self._result_cache = TTLCache(
+            maxsize=settings.governance_result_cache_size,
+            ttl=settings.governance_result_cache_ttl
+        )
+        
+        # Caps how many specialized agent subtasks run at once; resized by _load_configuration
+        self._dispatch_limit = settings.max_concurrent_agents
+        self._dispatch_sem = asyncio.Semaphore(self._dispatch_limit)
     
     async def _initialize_agent(self) -> None:
         """Initialize the core brain agent"""
@@ -86,6 +141,7 @@ class CoreBrainAgent(BaseAgent):
     
     async def _load_configuration(self) -> None:
         """Load core brain configuration"""
+        settings = get_settings()
         self.config = {
             "max_concurrent_tasks": settings.max_concurrent_agents,
             "task_timeout": settings.agent_timeout,
@@ -94,6 +150,11 @@ class CoreBrainAgent(BaseAgent):
             "enable_agent_communication": True,
             "enable_automatic_recovery": True
         }
+        
+        # Only replace the semaphore when the limit changes, so in-flight permits stay balanced
+        if self.config["max_concurrent_tasks"] != self._dispatch_limit:
+            self._dispatch_limit = self.config["max_concurrent_tasks"]
+            self._dispatch_sem = asyncio.Semaphore(self._dispatch_limit)
     
     async def _perform_health_check(self) -> bool:
         """Perform health check for core brain agent"""
@@ -138,7 +199,7 @@ class CoreBrainAgent(BaseAgent):
         try:
             # Parse governance request - input_data may be wrapped under "governance_request" key
             input_data = task.input_data.get("governance_request", task.input_data)
-            governance_request = GovernanceRequest(**input_data)
+            governance_request = GovernanceRequest.model_validate(input_data)
             
             self.logger.info(f"Processing governance request: {governance_request.request_id}")
             
@@ -148,15 +209,12 @@ class CoreBrainAgent(BaseAgent):
             # Create subtasks for specialized agents
             subtasks = await self._create_subtasks(governance_request, target_agents)
             
-            # Execute tasks in parallel
-            results = await self._execute_parallel_tasks(subtasks)
-            
-            # Aggregate and synthesize results
+            # Execute tasks in parallel, synthesizing results as they complete
             governance_response = await self._synthesize_results(
-                governance_request, results
+                governance_request, subtasks
             )
             
-            return governance_response.dict()
+            return governance_response.model_dump(mode="json")
             
         except Exception as e:
             self.logger.error(f"Failed to process governance task: {e}")
@@ -193,34 +251,41 @@ class CoreBrainAgent(BaseAgent):
         
         self.logger.info("Monitoring system initialized")
     
-    def _determine_target_agents(self, scope: GovernanceScope) -> List[str]:
-        """Determine which specialized agents to involve based on scope"""
-        return self.routing_rules.get(scope, [])
+    def _determine_target_agents(self, scope: GovernanceScope) -> Tuple[Tuple[str, Any], ...]:
+        """Determine which registered specialized agents to involve based on scope"""
+        return self._target_agents_cache(scope)
+    
+    def _resolve_target_agents(self, scope: GovernanceScope) -> Tuple[Tuple[str, Any], ...]:
+        """Resolve a scope's routing rule against the currently registered specialized agents"""
+        agents = self.specialized_agents
+        return tuple(
+            (name, agents[name]) for name in self._ROUTING_RULES.get(scope, ()) if name in agents
+        )
     
     async def _create_subtasks(
         self, 
         governance_request: GovernanceRequest, 
-        target_agents: List[str]
+        target_agents: Tuple[Tuple[str, Any], ...]
     ) -> List[AgentTask]:
         """Create subtasks for specialized agents"""
-        subtasks = []
-        
-        for agent_name in target_agents:
-            if agent_name in self.specialized_agents:
-                subtask = AgentTask(
-                    task_id=f"{governance_request.request_id}_{agent_name}",
-                    agent_id=self.specialized_agents[agent_name].agent_id,
-                    task_type="governance_validation",
-                    priority=governance_request.priority,
-                    input_data={
-                        "governance_request": governance_request.dict(),
-                        "agent_specific_context": self._get_agent_context(agent_name, governance_request)
-                    },
-                    timeout_seconds=governance_request.timeout_seconds
-                )
-                subtasks.append(subtask)
-        
-        return subtasks
+        # Serialize the request once and share it across every subtask
+        req_payload = governance_request.model_dump()
+        
+        # Validate every subtask in one call rather than constructing them one at a time
+        return AGENT_TASK_LIST_ADAPTER.validate_python([
+            {
+                "task_id": f"{governance_request.request_id}_{agent_name}",
+                "agent_id": agent.agent_id,
+                "task_type": "governance_validation",
+                "priority": governance_request.priority,
+                "input_data": {
+                    "governance_request": req_payload,
+                    "agent_specific_context": self._get_agent_context(agent_name, governance_request)
+                },
+                "timeout_seconds": governance_request.timeout_seconds
+            }
+            for agent_name, agent in target_agents
+        ])
     
     def _get_agent_context(self, agent_name: str, governance_request: GovernanceRequest) -> Dict[str, Any]:
         """Get agent-specific context for the governance request"""
@@ -232,89 +297,117 @@ class CoreBrainAgent(BaseAgent):
         }
         
         # Add agent-specific context based on agent type
-        if agent_name == "security_architecture":
-            context.update({
-                "security_frameworks": ["NIST", "ISO_27001", "OWASP"],
-                "threat_modeling_required": True
-            })
-        elif agent_name == "costing":
-            context.update({
-                "cost_analysis_period": "monthly",
-                "include_operational_costs": True
-            })
+        extra = self._AGENT_STATIC_CTX.get(agent_name)
+        if extra:
+            context.update(extra)
         
         return context
     
-    async def _execute_parallel_tasks(self, subtasks: List[AgentTask]) -> List[Dict[str, Any]]:
-        """Execute tasks in parallel across specialized agents"""
+    async def _stream_results(
+        self, subtasks: List[AgentTask]
+    ) -> AsyncIterator[Tuple[AgentTask, Dict[str, Any]]]:
+        """Yield (subtask, result) pairs from specialized agents as each one finishes"""
+        # Build reverse lookup: agent UUID -> agent object
+        agent_by_id = {agent.agent_id: agent for agent in self.specialized_agents.values()}
+        
+        # Busy agents queue the subtask instead of dropping it
+        tasks = []
+        cached = []
+        cache_keys: Dict[str, Tuple] = {}
+        for subtask in subtasks:
+            agent = agent_by_id.get(subtask.agent_id)
+            if agent:
+                cache_key = self._result_cache_key(subtask)
+                result = self._result_cache.get(cache_key)
+                if result is not None:
+                    cached.append((subtask, result))
+                    continue
+                cache_keys[subtask.task_id] = cache_key
+                tasks.append(asyncio.create_task(self._run_subtask(self._dispatch_sem, agent, subtask)))
+        
+        # Consumers close the stream with contextlib.aclosing, so stopping early or cancelling
+        # the request runs the finally block and leaves no orphaned subtasks behind
         try:
-            # Build reverse lookup: agent UUID -> agent object
-            agent_by_id = {agent.agent_id: agent for agent in self.specialized_agents.values()}
-
-            # Create tasks for each agent
-            tasks = []
-            for subtask in subtasks:
-                agent = agent_by_id.get(subtask.agent_id)
-                if agent and agent.status == AgentStatus.IDLE:
-                    task = asyncio.create_task(agent.process_task(subtask))
-                    tasks.append(task)
+            for subtask, result in cached:
+                yield subtask, result
             
-            # Execute all tasks in parallel
-            if tasks:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results
-                processed_results = []
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        self.logger.error(f"Task {subtasks[i].task_id} failed: {result}")
-                        processed_results.append({
-                            "status": "failed",
-                            "error": str(result),
-                            "agent": subtasks[i].agent_id
-                        })
-                    else:
-                        processed_results.append(result)
-                
-                return processed_results
-            else:
-                return []
-                
+            for next_done in asyncio.as_completed(tasks):
+                subtask, result = await next_done
+                if isinstance(result, Exception):
+                    self.logger.error(f"Task {subtask.task_id} failed: {result}")
+                    result = {
+                        "status": "failed",
+                        "error": str(result),
+                        "agent": subtask.agent_id
+                    }
+                elif result.get("status") == "completed":
+                    self._result_cache.set(cache_keys[subtask.task_id], result)
+                yield subtask, result
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    @staticmethod
+    def _result_cache_key(subtask: AgentTask) -> Tuple:
+        """Key a subtask's result on the agent and the request fields that determine it"""
+        request = subtask.input_data.get("governance_request", {})
+        return (
+            subtask.agent_id,
+            request.get("scope"),
+            frozenset(request.get("target_components") or ()),
+            frozenset(request.get("compliance_requirements") or ())
+        )
+    
+    def clear_result_cache(self) -> None:
+        """Drop all cached specialized agent results"""
+        self._result_cache.clear()
+    
+    @staticmethod
+    async def _run_subtask(
+        semaphore: asyncio.Semaphore, agent: BaseAgent, subtask: AgentTask
+    ) -> Tuple[AgentTask, Any]:
+        """Run a subtask, returning the exception instead of raising so results stay paired"""
+        try:
+            async with semaphore:
+                return subtask, await agent.run_queued_task(subtask)
         except Exception as e:
-            self.logger.error(f"Failed to execute parallel tasks: {e}")
-            raise
+            return subtask, e
     
     async def _synthesize_results(
         self, 
         governance_request: GovernanceRequest, 
-        agent_results: List[Dict[str, Any]]
+        subtasks: List[AgentTask]
     ) -> GovernanceResponse:
         """Synthesize results from all agents into a comprehensive response"""
         try:
-            # Collect all validation results
-            all_validation_results = []
-            risk_scores = []
-            compliance_scores = []
+            # Fold scores and lists in as each agent's result arrives
+            raw_validation_results = []
+            risk_total = 0.0
+            risk_count = 0
+            compliance_total = 0.0
+            compliance_count = 0
             recommendations = []
             agents_used = []
             
-            for result in agent_results:
-                if result.get("status") == "completed":
-                    # Extract validation results - reconstruct objects from dicts
+            async with aclosing(self._stream_results(subtasks)) as results:
+                async for _, result in results:
+                    if result.get("status") != "completed":
+                        continue
+                    
+                    # Extract validation results
                     if "validation_results" in result:
-                        for vr in result["validation_results"]:
-                            try:
-                                all_validation_results.append(
-                                    vr if isinstance(vr, ValidationResult) else ValidationResult(**vr)
-                                )
-                            except (ValidationError, Exception) as e:
-                                self.logger.warning(f"Skipping invalid validation result: {e}")
+                        raw_validation_results.extend(result["validation_results"])
                     
                     # Extract scores
-                    if "risk_score" in result:
-                        risk_scores.append(result["risk_score"])
-                    if "compliance_score" in result:
-                        compliance_scores.append(result["compliance_score"])
+                    if (risk_score := result.get("risk_score")) is not None:
+                        risk_total += risk_score
+                        risk_count += 1
+                    if (compliance_score := result.get("compliance_score")) is not None:
+                        compliance_total += compliance_score
+                        compliance_count += 1
                     
                     # Extract recommendations
                     if "recommendations" in result:
@@ -325,54 +418,87 @@ class CoreBrainAgent(BaseAgent):
                         agents_used.append(result["agent_id"])
             
             # Calculate overall scores
-            overall_risk_score = sum(risk_scores) / len(risk_scores) if risk_scores else 0.0
-            overall_compliance_score = sum(compliance_scores) / len(compliance_scores) if compliance_scores else 0.0
-            
-            # Determine overall status
-            overall_status = self._determine_overall_status(all_validation_results)
+            overall_risk_score = risk_total / risk_count if risk_count else 0.0
+            overall_compliance_score = compliance_total / compliance_count if compliance_count else 0.0
             
-            # Generate executive summary
-            summary = self._generate_executive_summary(
-                governance_request, all_validation_results, overall_risk_score, overall_compliance_score
+            args = (
+                governance_request,
+                raw_validation_results,
+                overall_risk_score,
+                overall_compliance_score,
+                recommendations,
+                agents_used
             )
             
-            # Generate next steps
-            next_steps = self._generate_next_steps(all_validation_results, recommendations)
-            
-            return GovernanceResponse(
-                request_id=governance_request.request_id,
-                status=overall_status,
-                summary=summary,
-                validation_results=all_validation_results,
-                risk_score=overall_risk_score,
-                compliance_score=overall_compliance_score,
-                recommendations=recommendations,
-                next_steps=next_steps,
-                processing_time_seconds=0.0,  # Will be calculated by caller
-                agents_used=agents_used
-            )
+            # Building the response is pure CPU work, so large result sets run off the event loop
+            if len(raw_validation_results) < self._SYNTHESIS_THREAD_THRESHOLD:
+                return self._build_governance_response(*args)
+            return await asyncio.to_thread(self._build_governance_response, *args)
             
         except Exception as e:
             self.logger.error(f"Failed to synthesize results: {e}")
             raise
     
-    def _determine_overall_status(self, validation_results: List[ValidationResult]) -> str:
-        """Determine overall governance status based on validation results"""
-        if not validation_results:
-            return "unknown"
+    def _build_governance_response(
+        self,
+        governance_request: GovernanceRequest,
+        raw_validation_results: List[Any],
+        risk_score: float,
+        compliance_score: float,
+        recommendations: List[str],
+        agents_used: List[str]
+    ) -> GovernanceResponse:
+        """Build the governance response from aggregated agent results"""
+        # Reconstruct validation result objects from dicts in one batch, falling back
+        # to one at a time only to skip the invalid entries
+        try:
+            all_validation_results = VALIDATION_RESULT_LIST_ADAPTER.validate_python(raw_validation_results)
+        except ValidationError:
+            all_validation_results = []
+            for vr in raw_validation_results:
+                try:
+                    all_validation_results.append(
+                        vr if isinstance(vr, ValidationResult) else ValidationResult(**vr)
+                    )
+                except (ValidationError, Exception) as e:
+                    self.logger.warning(f"Skipping invalid validation result: {e}")
         
-        # Count by status
-        status_counts = {}
-        for result in validation_results:
-            status = result.status
-            status_counts[status] = status_counts.get(status, 0) + 1
+        # Count validation results by status once and derive everything from the counts
+        status_counts = Counter(r.status for r in all_validation_results)
         
         # Determine overall status
-        if status_counts.get(ValidationStatus.FAILED, 0) > 0:
+        overall_status = self._determine_overall_status_from_counts(status_counts)
+        
+        # Generate executive summary
+        summary = self._generate_executive_summary(
+            governance_request, status_counts, risk_score, compliance_score
+        )
+        
+        # Generate next steps
+        next_steps = self._generate_next_steps(all_validation_results, recommendations)
+        
+        # Trusted: every field comes from the validated request and agent results above
+        return GovernanceResponse.construct_trusted(
+            request_id=governance_request.request_id,
+            status=overall_status,
+            summary=summary,
+            validation_results=all_validation_results,
+            risk_score=risk_score,
+            compliance_score=compliance_score,
+            recommendations=recommendations,
+            next_steps=next_steps,
+            processing_time_seconds=0.0,  # Will be calculated by caller
+            agents_used=agents_used
+        )
+    
+    @staticmethod
+    def _determine_overall_status_from_counts(status_counts: Dict[Any, int]) -> str:
+        """Determine overall governance status from validation result counts by status"""
+        if status_counts.get(_VALIDATION_FAILED, 0) > 0:
             return "failed"
-        elif status_counts.get(ValidationStatus.WARNING, 0) > 0:
+        elif status_counts.get(_VALIDATION_WARNING, 0) > 0:
             return "warning"
-        elif status_counts.get(ValidationStatus.PASSED, 0) > 0:
+        elif status_counts.get(_VALIDATION_PASSED, 0) > 0:
             return "passed"
         else:
             return "unknown"
@@ -380,15 +506,15 @@ class CoreBrainAgent(BaseAgent):
     def _generate_executive_summary(
         self,
         governance_request: GovernanceRequest,
-        validation_results: List[ValidationResult],
+        status_counts: Dict[Any, int],
         risk_score: float,
         compliance_score: float
     ) -> str:
-        """Generate executive summary of governance validation"""
-        total_validations = len(validation_results)
-        passed_validations = len([r for r in validation_results if r.status == ValidationStatus.PASSED])
-        failed_validations = len([r for r in validation_results if r.status == ValidationStatus.FAILED])
-        warning_validations = len([r for r in validation_results if r.status == ValidationStatus.WARNING])
+        """Generate executive summary of governance validation from result counts by status"""
+        total_validations = sum(status_counts.values())
+        passed_validations = status_counts.get(_VALIDATION_PASSED, 0)
+        failed_validations = status_counts.get(_VALIDATION_FAILED, 0)
+        warning_validations = status_counts.get(_VALIDATION_WARNING, 0)
         
         scope_label = governance_request.scope.value if hasattr(governance_request.scope, 'value') else governance_request.scope
         summary = f"""
@@ -404,7 +530,7 @@ class CoreBrainAgent(BaseAgent):
         - Risk Score: {risk_score:.1f}/100
         - Compliance Score: {compliance_score:.1f}/100
         
-        Status: {self._determine_overall_status(validation_results).upper()}
+        Status: {self._determine_overall_status_from_counts(status_counts).upper()}
         """
         
         return summary.strip()
@@ -415,26 +541,20 @@ class CoreBrainAgent(BaseAgent):
         recommendations: List[str]
     ) -> List[str]:
         """Generate next steps based on validation results and recommendations"""
-        next_steps = []
-        
-        # Prioritize failed validations
-        failed_results = [r for r in validation_results if r.status == ValidationStatus.FAILED]
-        for result in failed_results:
-            next_steps.append(f"Address {result.rule_name}: {result.message}")
-        
-        # Add high-priority recommendations
-        high_priority_recs = [rec for rec in recommendations if any(
-            keyword in rec.lower() for keyword in ["critical", "urgent", "immediate", "security"]
-        )]
-        next_steps.extend(high_priority_recs[:3])  # Limit to top 3
+        # Failed validations come first, then up to 3 high-priority recommendations.
+        # Candidates are produced lazily in priority order, so scanning stops at 5 next steps
+        failed_steps = (
+            f"Address {result.rule_name}: {result.message}"
+            for result in validation_results if result.status == _VALIDATION_FAILED
+        )
+        high_priority_recs = islice(filter(self._HIGH_PRIO_RE.search, recommendations), 3)
+        next_steps = list(islice(chain(failed_steps, high_priority_recs), 5))
         
         # Add general next steps
         if not next_steps:
-            next_steps.append("Review all validation results and recommendations")
-            next_steps.append("Implement recommended improvements")
-            next_steps.append("Schedule follow-up validation")
+            next_steps = list(self._DEFAULT_NEXT_STEPS)
         
-        return next_steps[:5]  # Limit to 5 next steps
+        return next_steps
     
     async def _cleanup(self) -> None:
         """Cleanup core brain agent resources"""
@@ -449,37 +569,48 @@ class CoreBrainAgent(BaseAgent):
     def register_specialized_agent(self, agent_name: str, agent_instance: Any) -> None:
         """Register a specialized agent with the core brain"""
         self.specialized_agents[agent_name] = agent_instance
+        self._target_agents_cache.cache_clear()
+        self._result_cache.clear()
         self.logger.info(f"Registered specialized agent: {agent_name}")
     
     async def get_swarm_status(self) -> Dict[str, Any]:
         """Get status of the entire agent swarm"""
+        names = list(self.specialized_agents)
+        
+        # Collect status from the core brain and all specialized agents concurrently
+        core_status, *statuses = await asyncio.gather(
+            self.get_status(),
+            *(agent.get_status() for agent in self.specialized_agents.values()),
+            return_exceptions=True
+        )
+        if isinstance(core_status, Exception):
+            raise core_status
+        
         swarm_status = {
-            "core_brain": await self.get_status(),
+            "core_brain": core_status,
             "specialized_agents": {},
             "overall_health": 100.0,
             "active_tasks": 0,
-            "total_agents": len(self.specialized_agents) + 1
+            "total_agents": len(names) + 1
         }
         
-        # Collect status from all specialized agents
         total_health = 100.0
         active_tasks = 0
         
-        for agent_name, agent in self.specialized_agents.items():
-            try:
-                agent_status = await agent.get_status()
-                swarm_status["specialized_agents"][agent_name] = agent_status
-                
-                total_health += agent_status.get("health_score", 100.0)
-                if agent_status.get("current_task"):
-                    active_tasks += 1
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to get status for {agent_name}: {e}")
-                swarm_status["specialized_agents"][agent_name] = {"status": "error", "error": str(e)}
+        for agent_name, agent_status in zip(names, statuses):
+            if isinstance(agent_status, Exception):
+                self.logger.error(f"Failed to get status for {agent_name}: {agent_status}")
+                swarm_status["specialized_agents"][agent_name] = {"status": "error", "error": str(agent_status)}
+                continue
+            
+            swarm_status["specialized_agents"][agent_name] = agent_status
+            
+            total_health += agent_status.get("health_score", 100.0)
+            if agent_status.get("current_task"):
+                active_tasks += 1
         
         # Calculate overall health
-        swarm_status["overall_health"] = total_health / (len(self.specialized_agents) + 1)
+        swarm_status["overall_health"] = total_health / (len(names) + 1)
         swarm_status["active_tasks"] = active_tasks
         
         return swarm_status
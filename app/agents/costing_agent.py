@@ -1,62 +0,0 @@
-from typing import Dict, Any
-"""
-Costing Agent - Cost analysis and optimization
-"""
-
-from app.agents.base_agent import BaseAgent
-from app.models.agents import AgentType, AgentStatus, AgentTask
-from app.models.governance import ValidationResult, ValidationStatus, ValidationSeverity
-
-
-class CostingAgent(BaseAgent):
-    """Costing Agent for cost analysis and optimization"""
-    
-    def __init__(self):
-        super().__init__(
-            agent_type=AgentType.COSTING,
-            name="Costing Agent",
-            description="Analyzes costs and provides optimization recommendations"
-        )
-    
-    async def _initialize_agent(self) -> None:
-        self.logger.info("Initializing Costing Agent")
-    
-    async def _load_configuration(self) -> None:
-        self.config = {
-            "validation_rules": ["cost_analysis", "optimization", "budget_compliance"],
-            "compliance_frameworks": ["Financial_Standards"]
-        }
-    
-    async def _perform_health_check(self) -> bool:
-        return True
-    
-    async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
-        try:
-            validation_results = []
-            
-            cost_result = self.create_validation_result(
-                rule_id="COST_001",
-                rule_name="Cost Analysis",
-                rule_description="Validates cost efficiency and optimization",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
-                message="Cost analysis shows good efficiency",
-                recommendations=["Continue cost monitoring"]
-            )
-            validation_results.append(cost_result)
-            
-            return {
-                "status": "completed",
-                "agent_id": self.agent_id,
-                "validation_results": [result.dict() for result in validation_results],
-                "risk_score": 15.0,
-                "compliance_score": 92.0,
-                "recommendations": ["Monitor costs regularly", "Optimize resource usage"],
-                "domain": "costing"
-            }
-        except Exception as e:
-            self.logger.error(f"Task processing failed: {e}")
-            raise
-    
-    async def _cleanup(self) -> None:
-        self.logger.info("Costing Agent cleanup complete")
@@ -1,62 +0,0 @@
-from typing import Dict, Any
-"""
-Data Architecture Agent - Data quality and governance validation
-"""
-
-from app.agents.base_agent import BaseAgent
-from app.models.agents import AgentType, AgentStatus, AgentTask
-from app.models.governance import ValidationResult, ValidationStatus, ValidationSeverity
-
-
-class DataArchitectureAgent(BaseAgent):
-    """Data Architecture Agent for data quality and governance validation"""
-    
-    def __init__(self):
-        super().__init__(
-            agent_type=AgentType.DATA_ARCHITECTURE,
-            name="Data Architecture Agent",
-            description="Validates data architecture and governance"
-        )
-    
-    async def _initialize_agent(self) -> None:
-        self.logger.info("Initializing Data Architecture Agent")
-    
-    async def _load_configuration(self) -> None:
-        self.config = {
-            "validation_rules": ["data_quality", "data_governance", "compliance"],
-            "compliance_frameworks": ["GDPR", "SOX", "HIPAA"]
-        }
-    
-    async def _perform_health_check(self) -> bool:
-        return True
-    
-    async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
-        try:
-            validation_results = []
-            
-            data_result = self.create_validation_result(
-                rule_id="DATA_001",
-                rule_name="Data Quality Assessment",
-                rule_description="Validates data quality and governance",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
-                message="Data quality meets standards",
-                recommendations=["Continue data quality monitoring"]
-            )
-            validation_results.append(data_result)
-            
-            return {
-                "status": "completed",
-                "agent_id": self.agent_id,
-                "validation_results": [result.dict() for result in validation_results],
-                "risk_score": 18.0,
-                "compliance_score": 85.0,
-                "recommendations": ["Monitor data quality", "Maintain data governance"],
-                "domain": "data_architecture"
-            }
-        except Exception as e:
-            self.logger.error(f"Task processing failed: {e}")
-            raise
-    
-    async def _cleanup(self) -> None:
-        self.logger.info("Data Architecture Agent cleanup complete")
@@ -1,62 +0,0 @@
-from typing import Dict, Any
-"""
-Generic Agent - General purpose agent for various tasks
-"""
-
-from app.agents.base_agent import BaseAgent
-from app.models.agents import AgentType, AgentStatus, AgentTask
-from app.models.governance import ValidationResult, ValidationStatus, ValidationSeverity
-
-
-class GenericAgent(BaseAgent):
-    """Generic Agent for general purpose tasks"""
-    
-    def __init__(self):
-        super().__init__(
-            agent_type=AgentType.GENERIC,
-            name="Generic Agent",
-            description="Handles general purpose tasks and queries"
-        )
-    
-    async def _initialize_agent(self) -> None:
-        self.logger.info("Initializing Generic Agent")
-    
-    async def _load_configuration(self) -> None:
-        self.config = {
-            "validation_rules": ["general_validation", "query_processing"],
-            "compliance_frameworks": ["General"]
-        }
-    
-    async def _perform_health_check(self) -> bool:
-        return True
-    
-    async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
-        try:
-            validation_results = []
-            
-            generic_result = self.create_validation_result(
-                rule_id="GEN_001",
-                rule_name="General Validation",
-                rule_description="Performs general validation tasks",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
-                message="General validation completed successfully",
-                recommendations=["Continue monitoring"]
-            )
-            validation_results.append(generic_result)
-            
-            return {
-                "status": "completed",
-                "agent_id": self.agent_id,
-                "validation_results": [result.dict() for result in validation_results],
-                "risk_score": 10.0,
-                "compliance_score": 95.0,
-                "recommendations": ["Continue general monitoring"],
-                "domain": "generic"
-            }
-        except Exception as e:
-            self.logger.error(f"Task processing failed: {e}")
-            raise
-    
-    async def _cleanup(self) -> None:
-        self.logger.info("Generic Agent cleanup complete")
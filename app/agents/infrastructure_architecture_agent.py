@@ -1,62 +0,0 @@
-from typing import Dict, Any
-"""
-Infrastructure Architecture Agent - Cloud infrastructure optimization
-"""
-
-from app.agents.base_agent import BaseAgent
-from app.models.agents import AgentType, AgentStatus, AgentTask
-from app.models.governance import ValidationResult, ValidationStatus, ValidationSeverity
-
-
-class InfrastructureArchitectureAgent(BaseAgent):
-    """Infrastructure Architecture Agent for cloud infrastructure optimization"""
-    
-    def __init__(self):
-        super().__init__(
-            agent_type=AgentType.INFRASTRUCTURE_ARCHITECTURE,
-            name="Infrastructure Architecture Agent",
-            description="Validates cloud infrastructure and optimization"
-        )
-    
-    async def _initialize_agent(self) -> None:
-        self.logger.info("Initializing Infrastructure Architecture Agent")
-    
-    async def _load_configuration(self) -> None:
-        self.config = {
-            "validation_rules": ["infrastructure_design", "optimization", "monitoring"],
-            "compliance_frameworks": ["AWS_WELL_ARCHITECTED", "AZURE_ARCHITECTURE", "GCP_ARCHITECTURE"]
-        }
-    
-    async def _perform_health_check(self) -> bool:
-        return True
-    
-    async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
-        try:
-            validation_results = []
-            
-            infra_result = self.create_validation_result(
-                rule_id="INFRA_001",
-                rule_name="Infrastructure Design Validation",
-                rule_description="Validates infrastructure design and optimization",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
-                message="Infrastructure design meets standards",
-                recommendations=["Continue infrastructure monitoring"]
-            )
-            validation_results.append(infra_result)
-            
-            return {
-                "status": "completed",
-                "agent_id": self.agent_id,
-                "validation_results": [result.dict() for result in validation_results],
-                "risk_score": 20.0,
-                "compliance_score": 87.0,
-                "recommendations": ["Monitor infrastructure performance", "Optimize resource usage"],
-                "domain": "infrastructure_architecture"
-            }
-        except Exception as e:
-            self.logger.error(f"Task processing failed: {e}")
-            raise
-    
-    async def _cleanup(self) -> None:
-        self.logger.info("Infrastructure Architecture Agent cleanup complete")
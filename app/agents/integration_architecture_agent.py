@@ -1,62 +1,40 @@
-from typing import Dict, Any
 """
 Integration Architecture Agent - API and service interoperability validation
 """
 
-from app.agents.base_agent import BaseAgent
-from app.models.agents import AgentType, AgentStatus, AgentTask
-from app.models.governance import ValidationResult, ValidationStatus, ValidationSeverity
+from app.agents.base_agent import AgentConfig, StaticValidationAgent, ValidationRuleSpec, ValidationSpec
+from app.models.agents import AgentType
 
 
-class IntegrationArchitectureAgent(BaseAgent):
+class IntegrationArchitectureAgent(StaticValidationAgent):
     """Integration Architecture Agent for API and service interoperability validation"""
     
-    def __init__(self):
-        super().__init__(
-            agent_type=AgentType.INTEGRATION_ARCHITECTURE,
-            name="Integration Architecture Agent",
-            description="Validates API design and service interoperability"
-        )
-    
-    async def _initialize_agent(self) -> None:
-        self.logger.info("Initializing Integration Architecture Agent")
+    __slots__ = ()
     
-    async def _load_configuration(self) -> None:
-        self.config = {
-            "validation_rules": ["api_design", "interoperability", "standards"],
-            "compliance_frameworks": ["REST", "GraphQL", "OpenAPI"]
-        }
+    CONFIG = AgentConfig(
+        validation_rules=("api_design", "interoperability", "standards"),
+        compliance_frameworks=("REST", "GraphQL", "OpenAPI")
+    )
     
-    async def _perform_health_check(self) -> bool:
-        return True
-    
-    async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
-        try:
-            validation_results = []
-            
-            integration_result = self.create_validation_result(
+    VALIDATION_SPEC = ValidationSpec(
+        rules=(
+            ValidationRuleSpec(
                 rule_id="INT_001",
                 rule_name="API Design Validation",
                 rule_description="Validates API design and interoperability",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
                 message="API design meets standards",
-                recommendations=["Continue API monitoring"]
-            )
-            validation_results.append(integration_result)
-            
-            return {
-                "status": "completed",
-                "agent_id": self.agent_id,
-                "validation_results": [result.dict() for result in validation_results],
-                "risk_score": 22.0,
-                "compliance_score": 88.0,
-                "recommendations": ["Monitor API performance", "Maintain API documentation"],
-                "domain": "integration_architecture"
-            }
-        except Exception as e:
-            self.logger.error(f"Task processing failed: {e}")
-            raise
+                recommendations=("Continue API monitoring",)
+            ),
+        ),
+        risk_score=22.0,
+        compliance_score=88.0,
+        recommendations=("Monitor API performance", "Maintain API documentation"),
+        domain="integration_architecture"
+    )
     
-    async def _cleanup(self) -> None:
-        self.logger.info("Integration Architecture Agent cleanup complete")
+    def __init__(self):
+        super().__init__(
+            agent_type=AgentType.INTEGRATION_ARCHITECTURE,
+            name="Integration Architecture Agent",
+            description="Validates API design and service interoperability"
+        )
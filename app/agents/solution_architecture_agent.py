@@ -1,96 +1,61 @@
-from typing import Dict, Any
 """
 Solution Architecture Agent - Validates solution designs and patterns
 """
 
-import logging
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
-from app.agents.base_agent import BaseAgent
-from app.models.agents import AgentType, AgentStatus, AgentTask
-from app.models.governance import ValidationResult, ValidationStatus, ValidationSeverity
+from app.agents.base_agent import AgentConfig, StaticValidationAgent, ValidationRuleSpec, ValidationSpec
+from app.models.agents import AgentType
 
 
-class SolutionArchitectureAgent(BaseAgent):
+# Solution patterns knowledge base
+SOLUTION_PATTERNS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "microservices": ("Scalability", "Maintainability", "Technology diversity"),
+    "event_driven": ("Loose coupling", "Scalability", "Real-time processing"),
+    "layered": ("Simplicity", "Maintainability", "Clear boundaries"),
+    "serverless": ("Auto-scaling", "Cost efficiency", "Reduced operational overhead")
+})
+
+
+class SolutionArchitectureAgent(StaticValidationAgent):
     """Solution Architecture Agent for validating solution designs and patterns"""
     
-    def __init__(self):
-        super().__init__(
-            agent_type=AgentType.SOLUTION_ARCHITECTURE,
-            name="Solution Architecture Agent",
-            description="Validates solution designs, patterns, and business alignment"
-        )
-        
-        # Solution patterns knowledge base
-        self.solution_patterns = {
-            "microservices": ["Scalability", "Maintainability", "Technology diversity"],
-            "event_driven": ["Loose coupling", "Scalability", "Real-time processing"],
-            "layered": ["Simplicity", "Maintainability", "Clear boundaries"],
-            "serverless": ["Auto-scaling", "Cost efficiency", "Reduced operational overhead"]
-        }
-    
-    async def _initialize_agent(self) -> None:
-        """Initialize the solution architecture agent"""
-        self.logger.info("Initializing Solution Architecture Agent")
+    __slots__ = ()
     
-    async def _load_configuration(self) -> None:
-        """Load solution architecture configuration"""
-        self.config = {
-            "validation_rules": ["business_alignment", "pattern_appropriateness", "scalability"],
-            "compliance_frameworks": ["TOGAF", "ISO_42010"]
-        }
+    CONFIG = AgentConfig(
+        validation_rules=("business_alignment", "pattern_appropriateness", "scalability"),
+        compliance_frameworks=("TOGAF", "ISO_42010")
+    )
     
-    async def _perform_health_check(self) -> bool:
-        """Perform health check for solution architecture agent"""
-        return True
-    
-    async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
-        """Process solution architecture validation task"""
-        try:
-            governance_request = task.input_data.get("governance_request", {})
-            
-            # Perform validations
-            validation_results = []
-            
-            # Business alignment check
-            business_result = self.create_validation_result(
+    VALIDATION_SPEC = ValidationSpec(
+        rules=(
+            ValidationRuleSpec(
                 rule_id="SOL_001",
                 rule_name="Business Alignment Check",
                 rule_description="Validates business alignment",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
                 message="Solution shows good business alignment",
-                recommendations=["Continue monitoring business value delivery"]
-            )
-            validation_results.append(business_result)
-            
-            # Pattern validation
-            pattern_result = self.create_validation_result(
+                recommendations=("Continue monitoring business value delivery",)
+            ),
+            ValidationRuleSpec(
                 rule_id="SOL_002",
                 rule_name="Solution Pattern Validation",
                 rule_description="Validates solution patterns",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
                 message="Solution pattern is appropriate",
-                recommendations=["Follow pattern best practices"]
-            )
-            validation_results.append(pattern_result)
-            
-            return {
-                "status": "completed",
-                "agent_id": self.agent_id,
-                "validation_results": [result.dict() for result in validation_results],
-                "risk_score": 15.0,
-                "compliance_score": 85.0,
-                "recommendations": ["Monitor business alignment", "Follow pattern best practices"],
-                "domain": "solution_architecture"
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Task processing failed: {e}")
-            raise
+                recommendations=("Follow pattern best practices",)
+            ),
+        ),
+        risk_score=15.0,
+        compliance_score=85.0,
+        recommendations=("Monitor business alignment", "Follow pattern best practices"),
+        domain="solution_architecture"
+    )
+    
+    solution_patterns = SOLUTION_PATTERNS
     
-    async def _cleanup(self) -> None:
-        """Cleanup resources"""
-        self.logger.info("Solution Architecture Agent cleanup complete")
+    def __init__(self):
+        super().__init__(
+            agent_type=AgentType.SOLUTION_ARCHITECTURE,
+            name="Solution Architecture Agent",
+            description="Validates solution designs, patterns, and business alignment"
+        )
@@ -1,85 +1,47 @@
-from typing import Dict, Any
 """
 Technical Architecture Agent - Code analysis and tech stack validation
 """
 
-import logging
-from typing import Dict, Any, List
+from app.agents.base_agent import AgentConfig, StaticValidationAgent, ValidationRuleSpec, ValidationSpec
+from app.models.agents import AgentType
 
-from app.agents.base_agent import BaseAgent
-from app.models.agents import AgentType, AgentStatus, AgentTask
-from app.models.governance import ValidationResult, ValidationStatus, ValidationSeverity
 
-
-class TechnicalArchitectureAgent(BaseAgent):
+class TechnicalArchitectureAgent(StaticValidationAgent):
     """Technical Architecture Agent for code analysis and tech stack validation"""
     
-    def __init__(self):
-        super().__init__(
-            agent_type=AgentType.TECHNICAL_ARCHITECTURE,
-            name="Technical Architecture Agent",
-            description="Analyzes code quality, tech stack, and technical debt"
-        )
-    
-    async def _initialize_agent(self) -> None:
-        """Initialize the technical architecture agent"""
-        self.logger.info("Initializing Technical Architecture Agent")
+    __slots__ = ()
     
-    async def _load_configuration(self) -> None:
-        """Load technical architecture configuration"""
-        self.config = {
-            "validation_rules": ["code_quality", "tech_stack", "technical_debt"],
-            "compliance_frameworks": ["TOGAF", "ISO_42010"]
-        }
+    CONFIG = AgentConfig(
+        validation_rules=("code_quality", "tech_stack", "technical_debt"),
+        compliance_frameworks=("TOGAF", "ISO_42010")
+    )
     
-    async def _perform_health_check(self) -> bool:
-        """Perform health check for technical architecture agent"""
-        return True
-    
-    async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
-        """Process technical architecture validation task"""
-        try:
-            # Perform validations
-            validation_results = []
-            
-            # Code quality check
-            code_result = self.create_validation_result(
+    VALIDATION_SPEC = ValidationSpec(
+        rules=(
+            ValidationRuleSpec(
                 rule_id="TECH_001",
                 rule_name="Code Quality Analysis",
                 rule_description="Validates code quality and standards",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
                 message="Code quality meets standards",
-                recommendations=["Continue code quality monitoring"]
-            )
-            validation_results.append(code_result)
-            
-            # Tech stack validation
-            tech_result = self.create_validation_result(
+                recommendations=("Continue code quality monitoring",)
+            ),
+            ValidationRuleSpec(
                 rule_id="TECH_002",
                 rule_name="Technology Stack Validation",
                 rule_description="Validates technology stack choices",
-                severity=ValidationSeverity.INFO,
-                status=ValidationStatus.PASSED,
                 message="Technology stack is appropriate",
-                recommendations=["Monitor technology lifecycle"]
-            )
-            validation_results.append(tech_result)
-            
-            return {
-                "status": "completed",
-                "agent_id": self.agent_id,
-                "validation_results": [result.dict() for result in validation_results],
-                "risk_score": 20.0,
-                "compliance_score": 80.0,
-                "recommendations": ["Monitor code quality", "Track tech stack lifecycle"],
-                "domain": "technical_architecture"
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Task processing failed: {e}")
-            raise
+                recommendations=("Monitor technology lifecycle",)
+            ),
+        ),
+        risk_score=20.0,
+        compliance_score=80.0,
+        recommendations=("Monitor code quality", "Track tech stack lifecycle"),
+        domain="technical_architecture"
+    )
     
-    async def _cleanup(self) -> None:
-        """Cleanup resources"""
-        self.logger.info("Technical Architecture Agent cleanup complete")
+    def __init__(self):
+        super().__init__(
+            agent_type=AgentType.TECHNICAL_ARCHITECTURE,
+            name="Technical Architecture Agent",
+            description="Analyzes code quality, tech stack, and technical debt"
+        )
@@ -0,0 +1,175 @@
+"""
+Template Agent - Data-driven agent for specialized domains with a single static validation
+"""
+
+from dataclasses import dataclass
+from typing import ClassVar, Dict
+
+from app.agents.base_agent import AgentConfig, StaticValidationAgent, ValidationRuleSpec, ValidationSpec
+from app.models.agents import AgentType
+
+
+@dataclass(frozen=True, slots=True)
+class AgentSpec:
+    """Static definition of a template agent's identity, configuration and validation output"""
+    agent_type: AgentType
+    name: str
+    description: str
+    config: AgentConfig
+    validation: ValidationSpec
+
+
+SPECS: Dict[AgentType, AgentSpec] = {
+    AgentType.COSTING: AgentSpec(
+        agent_type=AgentType.COSTING,
+        name="Costing Agent",
+        description="Analyzes costs and provides optimization recommendations",
+        config=AgentConfig(
+            validation_rules=("cost_analysis", "optimization", "budget_compliance"),
+            compliance_frameworks=("Financial_Standards",)
+        ),
+        validation=ValidationSpec(
+            rules=(
+                ValidationRuleSpec(
+                    rule_id="COST_001",
+                    rule_name="Cost Analysis",
+                    rule_description="Validates cost efficiency and optimization",
+                    message="Cost analysis shows good efficiency",
+                    recommendations=("Continue cost monitoring",)
+                ),
+            ),
+            risk_score=15.0,
+            compliance_score=92.0,
+            recommendations=("Monitor costs regularly", "Optimize resource usage"),
+            domain="costing"
+        )
+    ),
+    AgentType.DATA_ARCHITECTURE: AgentSpec(
+        agent_type=AgentType.DATA_ARCHITECTURE,
+        name="Data Architecture Agent",
+        description="Validates data architecture and governance",
+        config=AgentConfig(
+            validation_rules=("data_quality", "data_governance", "compliance"),
+            compliance_frameworks=("GDPR", "SOX", "HIPAA")
+        ),
+        validation=ValidationSpec(
+            rules=(
+                ValidationRuleSpec(
+                    rule_id="DATA_001",
+                    rule_name="Data Quality Assessment",
+                    rule_description="Validates data quality and governance",
+                    message="Data quality meets standards",
+                    recommendations=("Continue data quality monitoring",)
+                ),
+            ),
+            risk_score=18.0,
+            compliance_score=85.0,
+            recommendations=("Monitor data quality", "Maintain data governance"),
+            domain="data_architecture"
+        )
+    ),
+    AgentType.GENERIC: AgentSpec(
+        agent_type=AgentType.GENERIC,
+        name="Generic Agent",
+        description="Handles general purpose tasks and queries",
+        config=AgentConfig(
+            validation_rules=("general_validation", "query_processing"),
+            compliance_frameworks=("General",)
+        ),
+        validation=ValidationSpec(
+            rules=(
+                ValidationRuleSpec(
+                    rule_id="GEN_001",
+                    rule_name="General Validation",
+                    rule_description="Performs general validation tasks",
+                    message="General validation completed successfully",
+                    recommendations=("Continue monitoring",)
+                ),
+            ),
+            risk_score=10.0,
+            compliance_score=95.0,
+            recommendations=("Continue general monitoring",),
+            domain="generic"
+        )
+    ),
+    AgentType.INFRASTRUCTURE_ARCHITECTURE: AgentSpec(
+        agent_type=AgentType.INFRASTRUCTURE_ARCHITECTURE,
+        name="Infrastructure Architecture Agent",
+        description="Validates cloud infrastructure and optimization",
+        config=AgentConfig(
+            validation_rules=("infrastructure_design", "optimization", "monitoring"),
+            compliance_frameworks=("AWS_WELL_ARCHITECTED", "AZURE_ARCHITECTURE", "GCP_ARCHITECTURE")
+        ),
+        validation=ValidationSpec(
+            rules=(
+                ValidationRuleSpec(
+                    rule_id="INFRA_001",
+                    rule_name="Infrastructure Design Validation",
+                    rule_description="Validates infrastructure design and optimization",
+                    message="Infrastructure design meets standards",
+                    recommendations=("Continue infrastructure monitoring",)
+                ),
+            ),
+            risk_score=20.0,
+            compliance_score=87.0,
+            recommendations=("Monitor infrastructure performance", "Optimize resource usage"),
+            domain="infrastructure_architecture"
+        )
+    ),
+}
+
+
+class TemplateAgent(StaticValidationAgent):
+    """Static validation agent whose identity, configuration and validation output come from its SPEC
+    
+    Concrete agents subclass it and only set SPEC; CONFIG and VALIDATION_SPEC are derived from it.
+    """
+    
+    __slots__ = ()
+    
+    SPEC: ClassVar[AgentSpec]
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.CONFIG = cls.SPEC.config
+        cls.VALIDATION_SPEC = cls.SPEC.validation
+    
+    def __init__(self):
+        spec = self.SPEC
+        super().__init__(
+            agent_type=spec.agent_type,
+            name=spec.name,
+            description=spec.description
+        )
+
+
+class CostingAgent(TemplateAgent):
+    """Costing Agent for cost analysis and optimization"""
+    
+    __slots__ = ()
+    
+    SPEC = SPECS[AgentType.COSTING]
+
+
+class DataArchitectureAgent(TemplateAgent):
+    """Data Architecture Agent for data quality and governance validation"""
+    
+    __slots__ = ()
+    
+    SPEC = SPECS[AgentType.DATA_ARCHITECTURE]
+
+
+class GenericAgent(TemplateAgent):
+    """Generic Agent for general purpose tasks"""
+    
+    __slots__ = ()
+    
+    SPEC = SPECS[AgentType.GENERIC]
+
+
+class InfrastructureArchitectureAgent(TemplateAgent):
+    """Infrastructure Architecture Agent for cloud infrastructure optimization"""
+    
+    __slots__ = ()
+    
+    SPEC = SPECS[AgentType.INFRASTRUCTURE_ARCHITECTURE]
@@ -2,12 +2,14 @@
 Agent models for the Agentic AI Swarm system
 """
 
+from __future__ import annotations
+
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from enum import Enum
-from pydantic import Field
+from pydantic import ConfigDict, Field, TypeAdapter
 
-from .base import BaseModel
+from .base import BaseModel, InternedStr, utc_now
 
 
 class AgentType(str, Enum):
@@ -75,15 +77,15 @@ class Agent(BaseModel):
     last_error: Optional[str] = Field(None, description="Last error message")
     
     # Dependencies
-    dependencies: List[str] = Field(default_factory=list, description="Other agents this agent depends on")
+    dependencies: List[InternedStr] = Field(default_factory=list, description="Other agents this agent depends on")
     required_apis: List[str] = Field(default_factory=list, description="Required external APIs")
     
     # Resource usage
     memory_usage_mb: float = Field(0.0, description="Memory usage in MB")
     cpu_usage_percent: float = Field(0.0, description="CPU usage percentage")
     
-    class Config:
-        use_enum_values = True
+    # Agent records are read-only snapshots of an agent's state
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
 
 class AgentTask(BaseModel):
@@ -101,7 +103,7 @@ class AgentTask(BaseModel):
     timeout_seconds: int = Field(300, description="Task timeout")
     
     # Timing
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Task creation time")
+    created_at: datetime = Field(default_factory=utc_now, description="Task creation time")
     started_at: Optional[datetime] = Field(None, description="Task start time")
     completed_at: Optional[datetime] = Field(None, description="Task completion time")
     
@@ -127,10 +129,17 @@ class AgentCommunication(BaseModel):
     priority: str = Field("normal", description="Message priority")
     
     # Timing
-    sent_at: datetime = Field(default_factory=datetime.utcnow, description="Message sent time")
+    sent_at: datetime = Field(default_factory=utc_now, description="Message sent time")
     received_at: Optional[datetime] = Field(None, description="Message received time")
     
     # Status
     status: str = Field("sent", description="Message status")
     requires_response: bool = Field(False, description="Whether response is required")
     response_message_id: Optional[str] = Field(None, description="Response message ID")
+    
+    # Messages are immutable once sent; delivery updates produce a copy via model_copy(update=...)
+    model_config = ConfigDict(frozen=True)
+
+
+# Validates a whole list of tasks in one call, e.g. the subtasks of a governance request
+AGENT_TASK_LIST_ADAPTER = TypeAdapter(List[AgentTask])
@@ -2,12 +2,15 @@
 Architecture models for the Agentic AI Swarm system
 """
 
+from __future__ import annotations
+
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union
 from enum import Enum
-from pydantic import Field
+from pydantic import ConfigDict, Field
+from typing_extensions import TypedDict
 
-from .base import BaseModel
+from .base import BaseModel, InternedStr, enum_literal, utc_now
 
 
 class ArchitectureDomain(str, Enum):
@@ -20,6 +23,8 @@ class ArchitectureDomain(str, Enum):
     INFRASTRUCTURE = "infrastructure"
     APPLICATION = "application"
     BUSINESS = "business"
+    COSTING = "costing"
+    APPLICATION_PORTFOLIO = "application_portfolio"
 
 
 class ComponentType(str, Enum):
@@ -45,6 +50,10 @@ class ComponentStatus(str, Enum):
     IN_DEVELOPMENT = "in_development"
 
 
+# Literal field type for ComponentStatus, accepting either members or values
+ComponentStatusT = enum_literal(ComponentStatus)
+
+
 class ArchitectureComponent(BaseModel):
     """Architecture component"""
     
@@ -52,11 +61,11 @@ class ArchitectureComponent(BaseModel):
     name: str = Field(..., description="Component name")
     component_type: ComponentType = Field(..., description="Type of component")
     domain: ArchitectureDomain = Field(..., description="Architecture domain")
-    status: ComponentStatus = Field(..., description="Component status")
+    status: ComponentStatusT = Field(..., description="Component status")
     description: str = Field(..., description="Component description")
-    technologies: List[str] = Field(default_factory=list, description="Technologies used")
-    dependencies: List[str] = Field(default_factory=list, description="Component dependencies")
-    interfaces: List[str] = Field(default_factory=list, description="Component interfaces")
+    technologies: List[InternedStr] = Field(default_factory=list, description="Technologies used")
+    dependencies: List[InternedStr] = Field(default_factory=list, description="Component dependencies")
+    interfaces: List[InternedStr] = Field(default_factory=list, description="Component interfaces")
     configuration: Dict[str, Any] = Field(default_factory=dict, description="Component configuration")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
@@ -86,8 +95,8 @@ class ArchitectureDecision(BaseModel):
     consequences: List[str] = Field(default_factory=list, description="Decision consequences")
     alternatives_considered: List[str] = Field(default_factory=list, description="Alternatives considered")
     decision_drivers: List[str] = Field(default_factory=list, description="Decision drivers")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    created_at: datetime = Field(default_factory=utc_now, description="Creation timestamp")
+    updated_at: datetime = Field(default_factory=utc_now, description="Last update timestamp")
 
 
 class FileType(str, Enum):
@@ -140,10 +149,8 @@ class ArchitectureFile(BaseModel):
     patterns_identified: List[str] = Field(default_factory=list, description="Identified pattern IDs")
     decisions_extracted: List[str] = Field(default_factory=list, description="Extracted decision IDs")
     
-    # Processing results
-    extracted_text: Optional[str] = Field(None, description="Extracted text content")
-    extracted_images: List[str] = Field(default_factory=list, description="Extracted image paths")
-    diagrams_detected: List[str] = Field(default_factory=list, description="Detected diagram paths")
+    # Processing results; the extracted content itself lives in ArchitectureFileContent
+    extracted_text_ref: Optional[str] = Field(None, description="Storage path of the extracted text content")
     
     # Validation results
     validation_results: List[Dict[str, Any]] = Field(default_factory=list, description="Validation results")
@@ -151,7 +158,7 @@ class ArchitectureFile(BaseModel):
     quality_score: Optional[float] = Field(None, description="Quality score")
     
     # Timestamps
-    uploaded_at: datetime = Field(default_factory=datetime.utcnow, description="Upload timestamp")
+    uploaded_at: datetime = Field(default_factory=utc_now, description="Upload timestamp")
     processed_at: Optional[datetime] = Field(None, description="Processing completion timestamp")
     validated_at: Optional[datetime] = Field(None, description="Validation completion timestamp")
     
@@ -161,6 +168,59 @@ class ArchitectureFile(BaseModel):
     project_id: Optional[str] = Field(None, description="Project context")
 
 
+class ArchitectureFileContent(BaseModel):
+    """Extracted content of an architecture file, loaded on demand"""
+    
+    file_id: str = Field(..., description="File identifier")
+    extracted_text: Optional[str] = Field(None, description="Extracted text content")
+    extracted_images: List[str] = Field(default_factory=list, description="Extracted image paths")
+    diagrams_detected: List[str] = Field(default_factory=list, description="Detected diagram paths")
+
+
+class FoundComponent(TypedDict):
+    """Component mention extracted from document text"""
+    line: int
+    text: str
+    type: str
+    confidence: float
+
+
+class FoundPattern(TypedDict):
+    """Architecture pattern mention extracted from document text"""
+    line: int
+    text: str
+    pattern: str
+    confidence: float
+
+
+class FoundDecision(TypedDict):
+    """Architecture decision mention extracted from document text"""
+    line: int
+    text: str
+    type: str
+    confidence: float
+
+
+class DocumentMetadata(TypedDict, total=False):
+    """Document properties reported by the file processor; keys depend on the file type"""
+    title: str
+    author: str
+    subject: str
+    creator: str
+    producer: str
+    created: str
+    modified: str
+    revision: int
+    pages: int
+    slides: int
+    format: Optional[str]
+    mode: str
+    size: Union[int, Tuple[int, int]]
+    width: int
+    height: int
+    text_elements: int
+
+
 class FileProcessingResult(BaseModel):
     """File processing result"""
     
@@ -174,14 +234,17 @@ class FileProcessingResult(BaseModel):
     diagram_paths: List[str] = Field(default_factory=list, description="Extracted diagram paths")
     
     # Architecture elements
-    components_found: List[Dict[str, Any]] = Field(default_factory=list, description="Found components")
-    patterns_found: List[Dict[str, Any]] = Field(default_factory=list, description="Found patterns")
-    decisions_found: List[Dict[str, Any]] = Field(default_factory=list, description="Found decisions")
+    components_found: List[FoundComponent] = Field(default_factory=list, description="Found components")
+    patterns_found: List[FoundPattern] = Field(default_factory=list, description="Found patterns")
+    decisions_found: List[FoundDecision] = Field(default_factory=list, description="Found decisions")
     
     # Metadata
-    document_metadata: Dict[str, Any] = Field(default_factory=dict, description="Document metadata")
+    document_metadata: DocumentMetadata = Field(default_factory=dict, description="Document metadata")
     processing_time: float = Field(..., description="Processing time in seconds")
-    processed_at: datetime = Field(default_factory=datetime.utcnow, description="Processing timestamp")
+    processed_at: datetime = Field(default_factory=utc_now, description="Processing timestamp")
+    
+    # Processing results are read-only once produced
+    model_config = ConfigDict(frozen=True)
 
 
 class FileUploadRequest(BaseModel):
@@ -201,6 +264,6 @@ class FileValidationRequest(BaseModel):
     
     file_id: str = Field(..., description="File to validate")
     validation_rules: List[str] = Field(default_factory=list, description="Validation rules to apply")
-    compliance_frameworks: List[str] = Field(default_factory=list, description="Compliance frameworks")
+    compliance_frameworks: List[InternedStr] = Field(default_factory=list, description="Compliance frameworks")
     quality_standards: List[str] = Field(default_factory=list, description="Quality standards")
     priority: str = Field("medium", description="Validation priority")
@@ -2,23 +2,147 @@
 Base model classes for the Agentic AI Swarm system
 """
 
-from datetime import datetime
-from typing import Optional, Dict, Any
-from pydantic import BaseModel as PydanticBaseModel, Field
-from uuid import UUID, uuid4
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Literal, Optional, Dict, Any, Iterator, Type, TypeVar
+from pydantic import AfterValidator, BaseModel as PydanticBaseModel, BeforeValidator, ConfigDict, Field
+from typing_extensions import Annotated
+from uuid import UUID
+
+
+ModelT = TypeVar("ModelT", bound="BaseModel")
+
+# Strings shorter than this are interned, so repeated identifiers share one object
+_INTERN_MAX_LENGTH = 64
+
+
+def _intern(value: str) -> str:
+    return sys.intern(value) if len(value) < _INTERN_MAX_LENGTH else value
+
+
+# Use for low-cardinality identifier lists such as frameworks, tags and dependencies
+InternedStr = Annotated[str, AfterValidator(_intern)]
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def enum_literal(enum_cls: Type[Enum]) -> Any:
+    """Literal field type over an enum's values that also accepts the enum's members
+    
+    pydantic-core checks literals faster than enum lookups; members are unwrapped
+    to their values first so callers may pass either form.
+    """
+    return Annotated[Literal[tuple(member.value for member in enum_cls)], BeforeValidator(_enum_value)]
+
+
+# Random bytes for IDs are read from the OS in blocks rather than per ID
+_RANDOM_BUFFER = b""
+_RANDOM_OFFSET = 0
+_RANDOM_LOCK = threading.Lock()
+_RANDOM_REFILL = 4096
+
+
+def random_bytes(n: int) -> bytes:
+    """Return n random bytes drawn from a shared block of OS entropy"""
+    global _RANDOM_BUFFER, _RANDOM_OFFSET
+    with _RANDOM_LOCK:
+        if _RANDOM_OFFSET + n > len(_RANDOM_BUFFER):
+            _RANDOM_BUFFER = os.urandom(max(_RANDOM_REFILL, n))
+            _RANDOM_OFFSET = 0
+        start = _RANDOM_OFFSET
+        _RANDOM_OFFSET += n
+        return _RANDOM_BUFFER[start:_RANDOM_OFFSET]
+
+
+_UUID7_VERSION_MASK = 0xF000 << 64
+_UUID7_VERSION = 0x7000 << 64
+_UUID_VARIANT_MASK = 0xC000 << 48
+_UUID_VARIANT_RFC4122 = 0x8000 << 48
+
+
+def sortable_uuid() -> UUID:
+    """Return a UUIDv7: a millisecond timestamp prefix followed by random bits, so IDs sort by creation time"""
+    rand = int.from_bytes(random_bytes(10), "big")
+    value = ((time.time_ns() // 1_000_000) << 80) | rand
+    value = (value & ~_UUID7_VERSION_MASK) | _UUID7_VERSION
+    value = (value & ~_UUID_VARIANT_MASK) | _UUID_VARIANT_RFC4122
+    return UUID(int=value)
+
+
+class _EmptyMetadata(dict):
+    """Empty metadata shared by every model that never sets any; mutating it raises"""
+    
+    __slots__ = ()
+    
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Default metadata is shared and read-only; assign a new dict instead")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+_EMPTY_METADATA = _EmptyMetadata()
+
+
+def _empty_metadata() -> Dict[str, Any]:
+    return _EMPTY_METADATA
+
+
+# Timestamp pinned by an enclosing now_batched() block, if any
+_BATCH_NOW: ContextVar[Optional[datetime]] = ContextVar("_BATCH_NOW", default=None)
+
+
+def utc_now() -> datetime:
+    """Current timezone-aware UTC time, or the timestamp pinned by now_batched()"""
+    return _BATCH_NOW.get() or datetime.now(timezone.utc)
+
+
+@contextmanager
+def now_batched() -> Iterator[datetime]:
+    """Stamp every model created inside the block with one shared timestamp"""
+    now = datetime.now(timezone.utc)
+    token = _BATCH_NOW.set(now)
+    try:
+        yield now
+    finally:
+        _BATCH_NOW.reset(token)
 
 
 class BaseModel(PydanticBaseModel):
     """Base model with common functionality"""
     
-    id: UUID = Field(default_factory=uuid4)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    id: UUID = Field(default_factory=sortable_uuid)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+    metadata: Optional[Dict[str, Any]] = Field(default_factory=_empty_metadata)
+    
+    # datetime and UUID serialize to ISO strings natively in JSON mode, so no custom encoders are needed
+    model_config = ConfigDict(use_enum_values=True)
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v)
-        }
-        use_enum_values = True
+    @classmethod
+    def construct_trusted(cls: Type[ModelT], **data: Any) -> ModelT:
+        """Build an instance from already-validated internal data without running validation
+        
+        Only for values produced inside the service; input crossing an API boundary
+        must go through normal construction so it is validated.
+        """
+        # Lay fields out in declaration order, as validation does, so dumps and
+        # equality match a validated instance built from the same data
+        values: Dict[str, Any] = {}
+        for name, field in cls.model_fields.items():
+            if name in data:
+                values[name] = data[name]
+            elif not field.is_required():
+                values[name] = field.get_default(call_default_factory=True)
+        values.update(data)
+        return cls.model_construct(_fields_set=set(data), **values)
@@ -1,13 +1,19 @@
 """
 Governance models for the Agentic AI Swarm system
+
+GovernanceRequest is validated at the API boundary. GovernanceResponse and
+ValidationResult are trusted-outbound: they are assembled inside the service,
+serialized directly, and never revalidated against a response_model.
 """
 
+from __future__ import annotations
+
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from enum import Enum
-from pydantic import Field
+from pydantic import ConfigDict, Field, TypeAdapter
 
-from .base import BaseModel
+from .base import BaseModel, InternedStr, enum_literal, utc_now
 
 
 class ValidationSeverity(str, Enum):
@@ -28,6 +34,11 @@ class ValidationStatus(str, Enum):
     ERROR = "error"
 
 
+# Literal field types for the enums above, accepting either members or values
+ValidationSeverityT = enum_literal(ValidationSeverity)
+ValidationStatusT = enum_literal(ValidationStatus)
+
+
 class GovernanceScope(str, Enum):
     """Governance scope types"""
     SOLUTION = "solution"
@@ -47,15 +58,19 @@ class ValidationResult(BaseModel):
     rule_id: str = Field(..., description="Unique identifier for the validation rule")
     rule_name: str = Field(..., description="Human-readable name of the validation rule")
     rule_description: str = Field(..., description="Description of what the rule validates")
-    severity: ValidationSeverity = Field(..., description="Severity level of the validation")
-    status: ValidationStatus = Field(..., description="Validation status")
+    severity: ValidationSeverityT = Field(..., description="Severity level of the validation")
+    status: ValidationStatusT = Field(..., description="Validation status")
     message: str = Field(..., description="Validation message")
     details: Optional[Dict[str, Any]] = Field(default=None, description="Additional validation details")
     recommendations: List[str] = Field(default_factory=list, description="Recommendations for improvement")
-    compliance_frameworks: List[str] = Field(default_factory=list, description="Relevant compliance frameworks")
+    compliance_frameworks: List[InternedStr] = Field(default_factory=list, description="Relevant compliance frameworks")
     domain: GovernanceScope = Field(..., description="Architecture domain this validation belongs to")
 
 
+# Validates or dumps a whole list of results in one call instead of one model at a time
+VALIDATION_RESULT_LIST_ADAPTER = TypeAdapter(List[ValidationResult])
+
+
 class GovernanceRequest(BaseModel):
     """Governance validation request"""
     
@@ -64,7 +79,7 @@ class GovernanceRequest(BaseModel):
     target_components: List[str] = Field(default_factory=list, description="Specific components to validate")
     business_context: Dict[str, Any] = Field(default_factory=dict, description="Business context and requirements")
     technical_context: Dict[str, Any] = Field(default_factory=dict, description="Technical context and constraints")
-    compliance_requirements: List[str] = Field(default_factory=list, description="Required compliance frameworks")
+    compliance_requirements: List[InternedStr] = Field(default_factory=list, description="Required compliance frameworks")
     priority: str = Field("medium", description="Request priority")
     timeout_seconds: int = Field(300, description="Request timeout in seconds")
     user_id: Optional[str] = Field(None, description="User making the request")
@@ -82,6 +97,9 @@ class GovernanceResponse(BaseModel):
     compliance_score: float = Field(..., description="Overall compliance score (0-100)")
     recommendations: List[str] = Field(default_factory=list, description="High-level recommendations")
     next_steps: List[str] = Field(default_factory=list, description="Recommended next steps")
-    generated_at: datetime = Field(default_factory=datetime.utcnow, description="When the response was generated")
+    generated_at: datetime = Field(default_factory=utc_now, description="When the response was generated")
     processing_time_seconds: float = Field(..., description="Total processing time")
     agents_used: List[str] = Field(default_factory=list, description="Agents that participated in validation")
+    
+    # Responses are read-only once assembled
+    model_config = ConfigDict(frozen=True)
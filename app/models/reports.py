@@ -2,12 +2,14 @@
 Report models for the Agentic AI Swarm system
 """
 
+from __future__ import annotations
+
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from enum import Enum
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
-from .base import BaseModel
+from .base import BaseModel, InternedStr, enum_literal, utc_now
 
 
 class ReportType(str, Enum):
@@ -34,6 +36,10 @@ class ReportStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+# Literal field type for ReportStatus, accepting either members or values
+ReportStatusT = enum_literal(ReportStatus)
+
+
 class ReportFormat(str, Enum):
     """Report output formats"""
     PDF = "pdf"
@@ -48,7 +54,7 @@ class Report(BaseModel):
     
     title: str = Field(..., description="Report title")
     report_type: ReportType = Field(..., description="Type of report")
-    status: ReportStatus = Field(ReportStatus.DRAFT, description="Report status")
+    status: ReportStatusT = Field("draft", description="Report status")
     
     # Content and data
     summary: str = Field(..., description="Executive summary")
@@ -58,7 +64,7 @@ class Report(BaseModel):
     
     # Scope and context
     scope: str = Field(..., description="Report scope")
-    target_audience: List[str] = Field(default_factory=list, description="Target audience")
+    target_audience: List[InternedStr] = Field(default_factory=list, description="Target audience")
     business_context: Dict[str, Any] = Field(default_factory=dict, description="Business context")
     
     # Data sources and methodology
@@ -73,7 +79,7 @@ class Report(BaseModel):
     cost_score: float = Field(0.0, description="Overall cost efficiency score (0-100)")
     
     # Timing and lifecycle
-    generated_at: datetime = Field(default_factory=datetime.utcnow, description="Generation timestamp")
+    generated_at: datetime = Field(default_factory=utc_now, description="Generation timestamp")
     valid_until: Optional[datetime] = Field(None, description="Report validity period")
     next_review_date: Optional[datetime] = Field(None, description="Next review date")
     
@@ -93,12 +99,11 @@ class Report(BaseModel):
     change_log: List[str] = Field(default_factory=list, description="Change log")
     
     # Distribution and access
-    distribution_list: List[str] = Field(default_factory=list, description="Distribution list")
+    distribution_list: List[InternedStr] = Field(default_factory=list, description="Distribution list")
     access_level: str = Field("internal", description="Access level")
-    tags: List[str] = Field(default_factory=list, description="Report tags")
+    tags: List[InternedStr] = Field(default_factory=list, description="Report tags")
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class ReportTemplate(BaseModel):
@@ -130,8 +135,7 @@ class ReportTemplate(BaseModel):
     is_active: bool = Field(True, description="Whether template is active")
     created_by: str = Field(..., description="Template creator")
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class ReportSchedule(BaseModel):
@@ -164,5 +168,4 @@ class ReportSchedule(BaseModel):
     max_retries: int = Field(3, description="Maximum retry attempts")
     error_notification: List[str] = Field(default_factory=list, description="Error notification recipients")
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
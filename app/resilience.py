@@ -0,0 +1,46 @@
+"""
+Failure-isolation helpers for calls to external services
+"""
+
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service whose circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Fails calls fast after fail_max consecutive failures, allowing a trial call every reset_timeout seconds"""
+
+    __slots__ = ("name", "fail_max", "reset_timeout", "_failures", "_opened_at")
+
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._failures >= self.fail_max
+
+    def check(self) -> None:
+        """Raise CircuitOpenError unless a call may go through"""
+        if not self.is_open:
+            return
+
+        remaining = self._opened_at + self.reset_timeout - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(f"{self.name} circuit is open; retry in {remaining:.0f}s")
+
+        # Half-open: let this call through as a trial and keep the rest failing fast until it reports back
+        self._opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
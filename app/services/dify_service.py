@@ -4,39 +4,168 @@ Enhanced Dify service for integration with hosted Dify platform
 
 import asyncio
 import aiohttp
+import copy
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
 
-from app.config import settings
+import orjson
+from tenacity import (
+    RetryCallState, retry, retry_if_exception_type, retry_if_result, stop_after_attempt, wait_exponential_jitter
+)
+
+from app.cache import TTLCache
+from app.config import get_settings
+from app.models.base import utc_now
+from app.resilience import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson; aiohttp expects a str from json_serialize"""
+    return orjson.dumps(obj).decode()
+
+
+def _is_server_error(result: Tuple[int, Any]) -> bool:
+    return result[0] >= 500
+
+
+def _last_outcome(retry_state: RetryCallState) -> Tuple[int, Any]:
+    """Once retries are exhausted, return the last 5xx response or re-raise the last error"""
+    return retry_state.outcome.result()
+
+
 class DifyService:
     """Service for interacting with hosted Dify platform"""
     
     def __init__(self):
+        settings = get_settings()
         self.api_key = settings.dify_api_key
         self.base_url = settings.dify_base_url
         self.workspace_id = settings.dify_workspace_id
         self.app_id = settings.dify_app_id
         
+        # Sent once as session defaults; aiohttp adds Content-Type itself for json= bodies
         self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
+            "Authorization": f"Bearer {self.api_key}"
         }
+        
+        # One pooled session for all calls, created on first use and closed by aclose()
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Successful completion responses keyed by endpoint, app, user, inputs and query
+        self._response_cache = TTLCache(
+            maxsize=settings.dify_response_cache_size,
+            ttl=settings.dify_response_cache_ttl
+        )
+        
+        # Futures for completion requests currently on the wire, keyed like the response cache
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        
+        # Stop sending requests for a while once Dify keeps failing
+        self._breaker = CircuitBreaker("Dify", fail_max=5, reset_timeout=60.0)
+    
+    @staticmethod
+    def _response_cache_key(
+        endpoint: str,
+        app_id: str,
+        user: str,
+        inputs: Dict[str, Any],
+        query: str
+    ) -> Tuple[Hashable, ...]:
+        """Build a hashable cache key; inputs are serialized with sorted keys so equal dicts match"""
+        return (endpoint, app_id, user, orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS), " ".join(query.split()))
+    
+    async def _coalesced(
+        self,
+        key: Hashable,
+        send: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Run send() unless an identical request is in flight, in which case await its result
+        
+        Only for idempotent requests; every caller gets its own deep copy of the shared response.
+        """
+        while (pending := self._inflight.get(key)) is not None:
+            try:
+                return copy.deepcopy(await asyncio.shield(pending))
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The request we joined failed; join a retry or send one ourselves
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await send()
+        except BaseException:
+            # Waiters only see cancellation; other errors propagate to the sender alone
+            future.cancel()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        
+        future.set_result(result)
+        return copy.deepcopy(result)
+    
+    def clear_response_cache(self) -> None:
+        """Drop every cached completion response"""
+        self._response_cache.clear()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it if needed"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                json_serialize=_json_dumps
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Tuple[int, Any]:
+        """Send a request through the circuit breaker; returns the status and the JSON body, or the error text"""
+        # The breaker sits outside the retries, so one logical call counts as at most one failure
+        self._breaker.check()
+        try:
+            status, body = await self._send(method, path, **kwargs)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._breaker.record_failure()
+            raise
+        
+        if status >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return status, body
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=0.2, max=2),
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)) | retry_if_result(_is_server_error),
+        retry_error_callback=_last_outcome
+    )
+    async def _send(self, method: str, path: str, **kwargs: Any) -> Tuple[int, Any]:
+        """Send one HTTP request, retrying connection errors, timeouts and 5xx responses"""
+        session = await self._get_session()
+        async with session.request(method, f"{self.base_url}{path}", **kwargs) as response:
+            status = response.status
+            if status == 200:
+                body = await response.json(loads=orjson.loads)
+            else:
+                body = await response.text()
+        return status, body
     
     async def health_check(self) -> bool:
         """Check if Dify service is accessible"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/info",
-                    headers=self.headers,
-                    timeout=10
-                ) as response:
-                    return response.status == 200
+            status, _ = await self._request("GET", "/info", timeout=10)
+            return status == 200
         except Exception as e:
             logger.error(f"Dify health check failed: {e}")
             return False
@@ -44,17 +173,12 @@ class DifyService:
     async def list_workspaces(self) -> List[Dict[str, Any]]:
         """List available workspaces"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/workspaces",
-                    headers=self.headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("data", [])
-                    else:
-                        logger.error(f"Failed to list workspaces: {response.status}")
-                        return []
+            status, data = await self._request("GET", "/workspaces")
+            if status == 200:
+                return data.get("data", [])
+            else:
+                logger.error(f"Failed to list workspaces: {status}")
+                return []
         except Exception as e:
             logger.error(f"Error listing workspaces: {e}")
             return []
@@ -67,17 +191,12 @@ class DifyService:
                 logger.error("No workspace ID provided")
                 return []
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/workspaces/{workspace_id}/applications",
-                    headers=self.headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("data", [])
-                    else:
-                        logger.error(f"Failed to list applications: {response.status}")
-                        return []
+            status, data = await self._request("GET", f"/workspaces/{workspace_id}/applications")
+            if status == 200:
+                return data.get("data", [])
+            else:
+                logger.error(f"Failed to list applications: {status}")
+                return []
         except Exception as e:
             logger.error(f"Error listing applications: {e}")
             return []
@@ -88,9 +207,11 @@ class DifyService:
         app_id: Optional[str] = None,
         user_id: Optional[str] = None,
         conversation_id: Optional[str] = None,
-        inputs: Optional[Dict[str, Any]] = None
+        inputs: Optional[Dict[str, Any]] = None,
+        static_system: Optional[str] = None,
+        dynamic_context: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Chat completion using Dify"""
+        """Chat completion using Dify; static_system must stay byte-identical across turns to hit prompt caches"""
         try:
             app_id = app_id or self.app_id
             if not app_id:
@@ -99,9 +220,19 @@ class DifyService:
                     "error": "No app ID provided"
                 }
             
+            # The static system prompt (persona, tools) goes in the inputs so it forms a stable
+            # prefix; per-query context such as memories rides with the user's message instead
+            inputs = inputs or {}
+            if static_system is not None:
+                inputs = {**inputs, "system": static_system}
+            
+            query = messages[-1].get("content", "") if messages else ""
+            if dynamic_context:
+                query = f"[context]\n{dynamic_context}\n\n{query}"
+            
             payload = {
-                "inputs": inputs or {},
-                "query": messages[-1].get("content", "") if messages else "",
+                "inputs": inputs,
+                "query": query,
                 "response_mode": "blocking",
                 "user": user_id or "default_user"
             }
@@ -109,34 +240,9 @@ class DifyService:
             if conversation_id:
                 payload["conversation_id"] = conversation_id
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat-messages",
-                    headers=self.headers,
-                    json=payload,
-                    params={"app_id": app_id}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "message": {
-                                "role": "assistant",
-                                "content": data.get("answer", "")
-                            },
-                            "conversation_id": data.get("conversation_id"),
-                            "message_id": data.get("id"),
-                            "usage": data.get("usage", {}),
-                            "created_at": datetime.utcnow().isoformat()
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Dify chat failed: {response.status} - {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"Chat failed: {response.status}",
-                            "details": error_text
-                        }
+            # Chat replies are never cached or shared: a new chat starts a server-side conversation,
+            # and a reused reply would hand its conversation_id to a caller expecting a fresh one
+            return await self._send_chat(app_id, payload)
                         
         except Exception as e:
             logger.error(f"Error with Dify chat: {e}")
@@ -145,6 +251,29 @@ class DifyService:
                 "error": str(e)
             }
     
+    async def _send_chat(self, app_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a chat message"""
+        status, data = await self._request("POST", "/chat-messages", json=payload, params={"app_id": app_id})
+        if status == 200:
+            return {
+                "success": True,
+                "message": {
+                    "role": "assistant",
+                    "content": data.get("answer", "")
+                },
+                "conversation_id": data.get("conversation_id"),
+                "message_id": data.get("id"),
+                "usage": data.get("usage", {}),
+                "created_at": utc_now().isoformat()
+            }
+        else:
+            logger.error(f"Dify chat failed: {status} - {data}")
+            return {
+                "success": False,
+                "error": f"Chat failed: {status}",
+                "details": data
+            }
+    
     async def completion(
         self,
         prompt: str,
@@ -168,30 +297,16 @@ class DifyService:
                 "user": user_id or "default_user"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/completion-messages",
-                    headers=self.headers,
-                    json=payload,
-                    params={"app_id": app_id}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "text": data.get("answer", ""),
-                            "message_id": data.get("id"),
-                            "usage": data.get("usage", {}),
-                            "created_at": datetime.utcnow().isoformat()
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Dify completion failed: {response.status} - {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"Completion failed: {response.status}",
-                            "details": error_text
-                        }
+            cache_key = self._response_cache_key(
+                "completion-messages", app_id, payload["user"], payload["inputs"], prompt
+            )
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                # Deep copies, so callers editing nested fields such as usage never touch the cache
+                return copy.deepcopy(cached)
+            
+            # Identical completions already on the wire share its response instead of sending their own
+            return await self._coalesced(cache_key, lambda: self._send_completion(app_id, cache_key, payload))
                         
         except Exception as e:
             logger.error(f"Error with Dify completion: {e}")
@@ -200,6 +315,32 @@ class DifyService:
                 "error": str(e)
             }
     
+    async def _send_completion(
+        self,
+        app_id: str,
+        cache_key: Hashable,
+        payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """POST a completion message, caching the response if it succeeds"""
+        status, data = await self._request("POST", "/completion-messages", json=payload, params={"app_id": app_id})
+        if status == 200:
+            result = {
+                "success": True,
+                "text": data.get("answer", ""),
+                "message_id": data.get("id"),
+                "usage": data.get("usage", {}),
+                "created_at": utc_now().isoformat()
+            }
+            self._response_cache.set(cache_key, copy.deepcopy(result))
+            return result
+        else:
+            logger.error(f"Dify completion failed: {status} - {data}")
+            return {
+                "success": False,
+                "error": f"Completion failed: {status}",
+                "details": data
+            }
+    
     async def get_conversation_history(
         self,
         conversation_id: str,
@@ -214,27 +355,22 @@ class DifyService:
                     "error": "No app ID provided"
                 }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/conversations/{conversation_id}/messages",
-                    headers=self.headers,
-                    params={"app_id": app_id}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "messages": data.get("data", []),
-                            "conversation_id": conversation_id
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get conversation history: {response.status} - {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"Failed to get history: {response.status}",
-                            "details": error_text
-                        }
+            status, data = await self._request(
+                "GET", f"/conversations/{conversation_id}/messages", params={"app_id": app_id}
+            )
+            if status == 200:
+                return {
+                    "success": True,
+                    "messages": data.get("data", []),
+                    "conversation_id": conversation_id
+                }
+            else:
+                logger.error(f"Failed to get conversation history: {status} - {data}")
+                return {
+                    "success": False,
+                    "error": f"Failed to get history: {status}",
+                    "details": data
+                }
                         
         except Exception as e:
             logger.error(f"Error getting conversation history: {e}")
@@ -265,27 +401,20 @@ class DifyService:
                 "workflow_data": workflow_data
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/workspaces/{workspace_id}/workflows",
-                    headers=self.headers,
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "workflow_id": data.get("id"),
-                            "workflow": data
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to create workflow: {response.status} - {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"Failed to create workflow: {response.status}",
-                            "details": error_text
-                        }
+            status, data = await self._request("POST", f"/workspaces/{workspace_id}/workflows", json=payload)
+            if status == 200:
+                return {
+                    "success": True,
+                    "workflow_id": data.get("id"),
+                    "workflow": data
+                }
+            else:
+                logger.error(f"Failed to create workflow: {status} - {data}")
+                return {
+                    "success": False,
+                    "error": f"Failed to create workflow: {status}",
+                    "details": data
+                }
                         
         except Exception as e:
             logger.error(f"Error creating workflow: {e}")
@@ -313,27 +442,22 @@ class DifyService:
                 "inputs": inputs
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/workspaces/{workspace_id}/workflows/{workflow_id}/execute",
-                    headers=self.headers,
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "outputs": data.get("outputs", {}),
-                            "execution_id": data.get("execution_id")
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to execute workflow: {response.status} - {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"Failed to execute workflow: {response.status}",
-                            "details": error_text
-                        }
+            status, data = await self._request(
+                "POST", f"/workspaces/{workspace_id}/workflows/{workflow_id}/execute", json=payload
+            )
+            if status == 200:
+                return {
+                    "success": True,
+                    "outputs": data.get("outputs", {}),
+                    "execution_id": data.get("execution_id")
+                }
+            else:
+                logger.error(f"Failed to execute workflow: {status} - {data}")
+                return {
+                    "success": False,
+                    "error": f"Failed to execute workflow: {status}",
+                    "details": data
+                }
                         
         except Exception as e:
             logger.error(f"Error executing workflow: {e}")
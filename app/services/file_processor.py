@@ -5,42 +5,398 @@ File processing service for architecture documents
 import os
 import logging
 import asyncio
+import html
+import multiprocessing
+import re
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
 import uuid
+import xml.etree.ElementTree as ET
 
 # File processing libraries
-import PyPDF2
 from docx import Document
 from pptx import Presentation
 from PIL import Image
 import fitz  # PyMuPDF for PDF processing
 import pytesseract
-from io import BytesIO
+from io import BytesIO, StringIO
 
+from app.models.base import utc_now
 from app.models.architecture import (
     ArchitectureFile, FileType, FileUploadStatus, FileProcessingResult,
-    ArchitectureDomain, ArchitectureComponent, ArchitecturePattern, ArchitectureDecision
+    ArchitectureDomain, ArchitectureComponent, ArchitecturePattern, ArchitectureDecision,
+    FoundComponent, FoundPattern, FoundDecision
 )
-from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _ProcResult:
+    """Raw output of one format parser, sent back from the worker process"""
+    text_content: str = ""
+    image_paths: List[str] = field(default_factory=list)
+    diagram_paths: List[str] = field(default_factory=list)
+    components_found: List[FoundComponent] = field(default_factory=list)
+    patterns_found: List[FoundPattern] = field(default_factory=list)
+    decisions_found: List[FoundDecision] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+# Worker processes for CPU-bound parsing; created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared parsing process pool, creating it on first use"""
+    global _process_pool
+    if _process_pool is None:
+        # Spawned workers start clean instead of forking the event loop, its threads and held locks
+        _process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the parsing process pool without waiting for queued work"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+_IMAGE_WRITE_THREADS = 4
+
+
+def _encode_pdf_page_images(doc, page, page_num: int, file_id: str, processed_dir: str) -> List[Tuple[str, bytes]]:
+    """Encode a PDF page's GRAY/RGB images as PNG, returning (path, bytes) pairs to be written"""
+    encoded = []
+    for img_index, img in enumerate(page.get_images()):
+        xref = img[0]
+        pix = fitz.Pixmap(doc, xref)
+        
+        if pix.n - pix.alpha < 4:  # GRAY or RGB
+            img_filename = f"{file_id}_page_{page_num}_img_{img_index}.png"
+            img_path = Path(processed_dir) / img_filename
+            encoded.append((str(img_path), pix.tobytes("png")))
+        
+        # Release each pixmap before decoding the next image
+        pix = None
+    
+    return encoded
+
+
+@lru_cache(maxsize=1)
+def _ocr_available() -> bool:
+    """Whether a Tesseract binary can be run; probed once per process since it spawns a subprocess"""
+    try:
+        return bool(pytesseract.get_tesseract_version())
+    except Exception:
+        return False
+
+
+# Fallback extraction for SVGs that are not well-formed XML
+_SVG_TEXT_RE = re.compile(r'<(?:\w+:)?text\b[^>]*>(.*?)</(?:\w+:)?text\s*>', re.DOTALL)
+_SVG_TAG_RE = re.compile(r'<[^>]*>')
+
+
+def _svg_text_stream(file_path: str) -> List[str]:
+    """Collect the text of every <text> element by streaming the XML, so memory follows depth rather than size"""
+    text_elements = []
+    text_depth = 0
+    for event, elem in ET.iterparse(file_path, events=("start", "end")):
+        is_text = elem.tag == "text" or elem.tag.endswith("}text")
+        if event == "start":
+            text_depth += is_text
+            continue
+        
+        if is_text:
+            text_depth -= 1
+            if not text_depth:
+                text_elements.append("".join(elem.itertext()))
+        # Children of a <text> (e.g. <tspan>) are kept until the <text> itself closes
+        if not text_depth:
+            elem.clear()
+    return text_elements
+
+
+def _svg_text_regex(file_path: str) -> List[str]:
+    """Collect <text> content from malformed SVG markup, stripping inner tags as itertext() would"""
+    with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+        svg_content = f.read()
+    return [html.unescape(_SVG_TAG_RE.sub("", text)) for text in _SVG_TEXT_RE.findall(svg_content)]
+
+
+# The format parsers are module-level functions so they can be pickled into the process pool
+def _pdf_worker(file_path: str, file_id: str, processed_dir: str) -> _ProcResult:
+    """Process PDF files"""
+    result = _ProcResult()
+    
+    try:
+        # Open PDF with PyMuPDF
+        doc = fitz.open(file_path)
+        
+        text_buffer = StringIO()
+        image_paths = []
+        
+        # PNG files are written on background threads so disk latency overlaps with
+        # decoding the rest of the document
+        with ThreadPoolExecutor(max_workers=_IMAGE_WRITE_THREADS) as image_writer:
+            image_writes = []
+            
+            # Walk the pages once, streaming text into a buffer and extracting images as we go;
+            # PyMuPDF is not thread-safe, so every document call stays on this thread
+            for page_num, page in enumerate(doc):
+                text_buffer.write(page.get_text())
+                text_buffer.write("\n")
+                for img_path, png_bytes in _encode_pdf_page_images(doc, page, page_num, file_id, processed_dir):
+                    image_paths.append(img_path)
+                    image_writes.append(image_writer.submit(Path(img_path).write_bytes, png_bytes))
+            
+            # Surface any failed write
+            for image_write in image_writes:
+                image_write.result()
+        
+        result.text_content = text_buffer.getvalue()
+        result.image_paths = image_paths
+        
+        # Extract metadata
+        metadata = doc.metadata
+        result.metadata = {
+            "title": metadata.get("title", ""),
+            "author": metadata.get("author", ""),
+            "subject": metadata.get("subject", ""),
+            "creator": metadata.get("creator", ""),
+            "producer": metadata.get("producer", ""),
+            "pages": len(doc)
+        }
+        
+        doc.close()
+        
+    except Exception as e:
+        logger.error(f"Error processing PDF {file_path}: {e}")
+        raise
+    
+    return result
+
+
+def _docx_worker(file_path: str, file_id: str, processed_dir: str) -> _ProcResult:
+    """Process DOCX files"""
+    result = _ProcResult()
+    
+    try:
+        doc = Document(file_path)
+        
+        # Extract text
+        text_content = []
+        for paragraph in doc.paragraphs:
+            text_content.append(paragraph.text)
+        
+        # Extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    text_content.append(cell.text)
+        
+        result.text_content = "\n".join(text_content)
+        
+        # Extract images
+        image_paths = []
+        for rel in doc.part.rels.values():
+            if "image" in rel.target_ref:
+                img_filename = f"{file_id}_{len(image_paths)}.png"
+                img_path = Path(processed_dir) / img_filename
+                
+                # Save image
+                with open(img_path, "wb") as f:
+                    f.write(rel.target_part.blob)
+                
+                image_paths.append(str(img_path))
+        
+        result.image_paths = image_paths
+        
+        # Extract metadata
+        core_props = doc.core_properties
+        result.metadata = {
+            "title": core_props.title or "",
+            "author": core_props.author or "",
+            "subject": core_props.subject or "",
+            "created": core_props.created.isoformat() if core_props.created else "",
+            "modified": core_props.modified.isoformat() if core_props.modified else "",
+            "revision": core_props.revision or 0
+        }
+        
+    except Exception as e:
+        logger.error(f"Error processing DOCX {file_path}: {e}")
+        raise
+    
+    return result
+
+
+def _pptx_worker(file_path: str, file_id: str, processed_dir: str) -> _ProcResult:
+    """Process PPTX files"""
+    result = _ProcResult()
+    
+    try:
+        prs = Presentation(file_path)
+        
+        # Walk every shape once, collecting its text and writing out its image on background threads
+        text_content = []
+        image_paths = []
+        with ThreadPoolExecutor(max_workers=_IMAGE_WRITE_THREADS) as image_writer:
+            image_writes = []
+            for slide_num, slide in enumerate(prs.slides):
+                for shape_num, shape in enumerate(slide.shapes):
+                    text = getattr(shape, "text", None)
+                    if text is not None:
+                        text_content.append(text)
+                    
+                    image = getattr(shape, "image", None)
+                    if image is not None:
+                        img_filename = f"{file_id}_slide_{slide_num}_shape_{shape_num}.png"
+                        img_path = Path(processed_dir) / img_filename
+                        image_writes.append(image_writer.submit(img_path.write_bytes, image.blob))
+                        image_paths.append(str(img_path))
+            
+            # Surface any failed write
+            for image_write in image_writes:
+                image_write.result()
+        
+        result.text_content = "\n".join(text_content)
+        result.image_paths = image_paths
+        
+        # Extract metadata
+        core_props = prs.core_properties
+        result.metadata = {
+            "title": core_props.title or "",
+            "author": core_props.author or "",
+            "subject": core_props.subject or "",
+            "created": core_props.created.isoformat() if core_props.created else "",
+            "modified": core_props.modified.isoformat() if core_props.modified else "",
+            "slides": len(prs.slides)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error processing PPTX {file_path}: {e}")
+        raise
+    
+    return result
+
+
+def _image_worker(file_path: str, file_id: str, processed_dir: str) -> _ProcResult:
+    """Process image files"""
+    result = _ProcResult()
+    
+    try:
+        # Extract text using OCR if available; Tesseract reads the file itself, so
+        # the image is never decoded and re-encoded to a temporary file here
+        try:
+            if _ocr_available():
+                text_content = pytesseract.image_to_string(file_path)
+                result.text_content = text_content
+        except Exception as ocr_error:
+            logger.warning(f"OCR failed for image {file_path}: {ocr_error}")
+        
+        # Add image to diagram paths (assuming it's an architecture diagram)
+        result.diagram_paths.append(file_path)
+        
+        # Extract metadata; opening only parses the header, pixel data is never loaded
+        with Image.open(file_path) as img:
+            result.metadata = {
+                "format": img.format,
+                "mode": img.mode,
+                "size": img.size,
+                "width": img.width,
+                "height": img.height
+            }
+        
+    except Exception as e:
+        logger.error(f"Error processing image {file_path}: {e}")
+        raise
+    
+    return result
+
+
+def _svg_worker(file_path: str, file_id: str, processed_dir: str) -> _ProcResult:
+    """Process SVG files"""
+    result = _ProcResult()
+    
+    try:
+        try:
+            text_elements = _svg_text_stream(file_path)
+        except ET.ParseError as parse_error:
+            logger.warning(f"SVG {file_path} is not well-formed XML, falling back to regex extraction: {parse_error}")
+            text_elements = _svg_text_regex(file_path)
+        
+        result.text_content = "\n".join(text_elements)
+        
+        # Add to diagram paths
+        result.diagram_paths.append(file_path)
+        
+        # Extract metadata
+        result.metadata = {
+            "format": "SVG",
+            "size": os.path.getsize(file_path),
+            "text_elements": len(text_elements)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error processing SVG {file_path}: {e}")
+        raise
+    
+    return result
+
+
+_NEWLINE_RE = re.compile(r"\n")
+
+
+def _keyword_matcher(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile keywords into one pattern that reports every (possibly overlapping) occurrence"""
+    # The zero-width lookahead lets a match start at every position, so keywords
+    # nested inside each other ("service" in "microservice") are all found
+    return re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))")
+
+
+# Simple keyword-based extraction, one multi-keyword matcher per category, compiled once per process
+_COMPONENT_KEYWORDS = (
+    "service", "database", "api", "microservice", "component", "module",
+    "frontend", "backend", "gateway", "load balancer", "cache", "queue"
+)
+_PATTERN_KEYWORDS = (
+    "pattern", "architecture pattern", "design pattern", "microservices",
+    "event-driven", "layered", "client-server", "peer-to-peer"
+)
+_DECISION_KEYWORDS = (
+    "decision", "adr", "architecture decision", "chosen", "selected",
+    "opted for", "decided to use"
+)
+_COMPONENT_MATCHER = _keyword_matcher(_COMPONENT_KEYWORDS)
+_PATTERN_MATCHER = _keyword_matcher(_PATTERN_KEYWORDS)
+_DECISION_MATCHER = _keyword_matcher(_DECISION_KEYWORDS)
+
+
+_WORKERS = {
+    FileType.PDF: _pdf_worker,
+    FileType.DOCX: _docx_worker,
+    FileType.PPTX: _pptx_worker,
+    FileType.PNG: _image_worker,
+    FileType.JPG: _image_worker,
+    FileType.JPEG: _image_worker,
+    FileType.SVG: _svg_worker,
+}
+
+
 class FileProcessor:
     """Service for processing architecture files"""
     
     def __init__(self):
-        self.supported_types = {
-            FileType.PDF: self._process_pdf,
-            FileType.DOCX: self._process_docx,
-            FileType.PPTX: self._process_pptx,
-            FileType.PNG: self._process_image,
-            FileType.JPG: self._process_image,
-            FileType.JPEG: self._process_image,
-            FileType.SVG: self._process_svg,
-        }
+        self.supported_types = _WORKERS
         
         # Create upload directory if it doesn't exist
         self.upload_dir = Path("uploads")
@@ -52,7 +408,7 @@ class FileProcessor:
     
     async def process_file(self, file_path: str, file_type: FileType, file_id: str) -> FileProcessingResult:
         """Process an uploaded file"""
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"Processing file {file_id} of type {file_type}")
@@ -62,26 +418,30 @@ class FileProcessor:
             if not processor:
                 raise ValueError(f"Unsupported file type: {file_type}")
             
-            # Process the file
-            result = await processor(file_path, file_id)
+            # Parsing is CPU-bound, so run it in a worker process to keep the event loop free
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                _get_process_pool(), processor, file_path, file_id, str(self.processed_dir)
+            )
             
             # Calculate processing time
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             # Create processing result
-            processing_result = FileProcessingResult(
+            # Trusted: built from this service's own extraction output
+            processing_result = FileProcessingResult.construct_trusted(
                 file_id=file_id,
                 processing_success=True,
                 processing_errors=[],
-                text_content=result.get("text_content"),
-                image_paths=result.get("image_paths", []),
-                diagram_paths=result.get("diagram_paths", []),
-                components_found=result.get("components_found", []),
-                patterns_found=result.get("patterns_found", []),
-                decisions_found=result.get("decisions_found", []),
-                document_metadata=result.get("metadata", {}),
+                text_content=result.text_content,
+                image_paths=result.image_paths,
+                diagram_paths=result.diagram_paths,
+                components_found=result.components_found,
+                patterns_found=result.patterns_found,
+                decisions_found=result.decisions_found,
+                document_metadata=result.metadata,
                 processing_time=processing_time,
-                processed_at=datetime.utcnow()
+                processed_at=utc_now()
             )
             
             logger.info(f"Successfully processed file {file_id} in {processing_time:.2f}s")
@@ -89,334 +449,83 @@ class FileProcessor:
             
         except Exception as e:
             logger.error(f"Failed to process file {file_id}: {e}")
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
-            return FileProcessingResult(
+            return FileProcessingResult.construct_trusted(
                 file_id=file_id,
                 processing_success=False,
                 processing_errors=[str(e)],
                 processing_time=processing_time,
-                processed_at=datetime.utcnow()
+                processed_at=utc_now()
             )
     
-    async def _process_pdf(self, file_path: str, file_id: str) -> Dict[str, Any]:
-        """Process PDF files"""
-        result = {
-            "text_content": "",
-            "image_paths": [],
-            "diagram_paths": [],
-            "components_found": [],
-            "patterns_found": [],
-            "decisions_found": [],
-            "metadata": {}
-        }
-        
-        try:
-            # Open PDF with PyMuPDF
-            doc = fitz.open(file_path)
-            
-            # Extract text
-            text_content = []
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text_content.append(page.get_text())
-            
-            result["text_content"] = "\n".join(text_content)
-            
-            # Extract images
-            image_paths = []
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                image_list = page.get_images()
-                
-                for img_index, img in enumerate(image_list):
-                    xref = img[0]
-                    pix = fitz.Pixmap(doc, xref)
-                    
-                    if pix.n - pix.alpha < 4:  # GRAY or RGB
-                        img_filename = f"{file_id}_page_{page_num}_img_{img_index}.png"
-                        img_path = self.processed_dir / img_filename
-                        pix.save(str(img_path))
-                        image_paths.append(str(img_path))
-                    
-                    pix = None
-            
-            result["image_paths"] = image_paths
-            
-            # Extract metadata
-            metadata = doc.metadata
-            result["metadata"] = {
-                "title": metadata.get("title", ""),
-                "author": metadata.get("author", ""),
-                "subject": metadata.get("subject", ""),
-                "creator": metadata.get("creator", ""),
-                "producer": metadata.get("producer", ""),
-                "pages": len(doc)
-            }
-            
-            doc.close()
-            
-        except Exception as e:
-            logger.error(f"Error processing PDF {file_path}: {e}")
-            raise
-        
-        return result
-    
-    async def _process_docx(self, file_path: str, file_id: str) -> Dict[str, Any]:
-        """Process DOCX files"""
-        result = {
-            "text_content": "",
-            "image_paths": [],
-            "diagram_paths": [],
-            "components_found": [],
-            "patterns_found": [],
-            "decisions_found": [],
-            "metadata": {}
-        }
-        
-        try:
-            doc = Document(file_path)
-            
-            # Extract text
-            text_content = []
-            for paragraph in doc.paragraphs:
-                text_content.append(paragraph.text)
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text_content.append(cell.text)
-            
-            result["text_content"] = "\n".join(text_content)
-            
-            # Extract images
-            image_paths = []
-            for rel in doc.part.rels.values():
-                if "image" in rel.target_ref:
-                    img_filename = f"{file_id}_{len(image_paths)}.png"
-                    img_path = self.processed_dir / img_filename
-                    
-                    # Save image
-                    with open(img_path, "wb") as f:
-                        f.write(rel.target_part.blob)
-                    
-                    image_paths.append(str(img_path))
-            
-            result["image_paths"] = image_paths
-            
-            # Extract metadata
-            core_props = doc.core_properties
-            result["metadata"] = {
-                "title": core_props.title or "",
-                "author": core_props.author or "",
-                "subject": core_props.subject or "",
-                "created": core_props.created.isoformat() if core_props.created else "",
-                "modified": core_props.modified.isoformat() if core_props.modified else "",
-                "revision": core_props.revision or 0
-            }
-            
-        except Exception as e:
-            logger.error(f"Error processing DOCX {file_path}: {e}")
-            raise
-        
-        return result
-    
-    async def _process_pptx(self, file_path: str, file_id: str) -> Dict[str, Any]:
-        """Process PPTX files"""
-        result = {
-            "text_content": "",
-            "image_paths": [],
-            "diagram_paths": [],
-            "components_found": [],
-            "patterns_found": [],
-            "decisions_found": [],
-            "metadata": {}
-        }
-        
-        try:
-            prs = Presentation(file_path)
-            
-            # Extract text from slides
-            text_content = []
-            for slide in prs.slides:
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        text_content.append(shape.text)
-            
-            result["text_content"] = "\n".join(text_content)
-            
-            # Extract images
-            image_paths = []
-            for slide_num, slide in enumerate(prs.slides):
-                for shape_num, shape in enumerate(slide.shapes):
-                    if hasattr(shape, "image"):
-                        img_filename = f"{file_id}_slide_{slide_num}_shape_{shape_num}.png"
-                        img_path = self.processed_dir / img_filename
-                        
-                        with open(img_path, "wb") as f:
-                            f.write(shape.image.blob)
-                        
-                        image_paths.append(str(img_path))
-            
-            result["image_paths"] = image_paths
-            
-            # Extract metadata
-            core_props = prs.core_properties
-            result["metadata"] = {
-                "title": core_props.title or "",
-                "author": core_props.author or "",
-                "subject": core_props.subject or "",
-                "created": core_props.created.isoformat() if core_props.created else "",
-                "modified": core_props.modified.isoformat() if core_props.modified else "",
-                "slides": len(prs.slides)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error processing PPTX {file_path}: {e}")
-            raise
-        
-        return result
-    
-    async def _process_image(self, file_path: str, file_id: str) -> Dict[str, Any]:
-        """Process image files"""
-        result = {
-            "text_content": "",
-            "image_paths": [],
-            "diagram_paths": [],
-            "components_found": [],
-            "patterns_found": [],
-            "decisions_found": [],
-            "metadata": {}
-        }
-        
-        try:
-            # Open image
-            img = Image.open(file_path)
-            
-            # Extract text using OCR if available
-            try:
-                if pytesseract.is_available():
-                    text_content = pytesseract.image_to_string(img)
-                    result["text_content"] = text_content
-            except Exception as ocr_error:
-                logger.warning(f"OCR failed for image {file_path}: {ocr_error}")
-            
-            # Add image to diagram paths (assuming it's an architecture diagram)
-            result["diagram_paths"].append(file_path)
-            
-            # Extract metadata
-            result["metadata"] = {
-                "format": img.format,
-                "mode": img.mode,
-                "size": img.size,
-                "width": img.width,
-                "height": img.height
-            }
-            
-        except Exception as e:
-            logger.error(f"Error processing image {file_path}: {e}")
-            raise
-        
-        return result
-    
-    async def _process_svg(self, file_path: str, file_id: str) -> Dict[str, Any]:
-        """Process SVG files"""
-        result = {
-            "text_content": "",
-            "image_paths": [],
-            "diagram_paths": [],
-            "components_found": [],
-            "patterns_found": [],
-            "decisions_found": [],
-            "metadata": {}
-        }
-        
-        try:
-            # Read SVG content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
-            
-            # Extract text from SVG (basic extraction)
-            import re
-            text_elements = re.findall(r'<text[^>]*>(.*?)</text>', svg_content, re.DOTALL)
-            result["text_content"] = "\n".join(text_elements)
-            
-            # Add to diagram paths
-            result["diagram_paths"].append(file_path)
-            
-            # Extract metadata
-            result["metadata"] = {
-                "format": "SVG",
-                "size": len(svg_content),
-                "text_elements": len(text_elements)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error processing SVG {file_path}: {e}")
-            raise
-        
-        return result
-    
     async def extract_architecture_elements(self, text_content: str) -> Dict[str, Any]:
         """Extract architecture elements from text content"""
         # This is a simplified extraction - in a real implementation,
         # you would use NLP and pattern matching to identify components, patterns, and decisions
         
-        components_found = []
-        patterns_found = []
-        decisions_found = []
+        components_found: List[FoundComponent] = []
+        patterns_found: List[FoundPattern] = []
+        decisions_found: List[FoundDecision] = []
         
-        # Simple keyword-based extraction
-        component_keywords = [
-            "service", "database", "api", "microservice", "component", "module",
-            "frontend", "backend", "gateway", "load balancer", "cache", "queue"
-        ]
+        # Lowercasing never adds or removes newlines, so line numbers in the
+        # lowered text line up with the original lines
+        lines = text_content.split('\n')
+        text_lower = text_content.lower()
+        line_starts = [0]
+        line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(text_lower))
         
-        pattern_keywords = [
-            "pattern", "architecture pattern", "design pattern", "microservices",
-            "event-driven", "layered", "client-server", "peer-to-peer"
-        ]
+        # A line hit by several keywords is stripped only once
+        stripped_lines: Dict[int, str] = {}
         
-        decision_keywords = [
-            "decision", "adr", "architecture decision", "chosen", "selected",
-            "opted for", "decided to use"
-        ]
+        def line_text(line_num: int) -> str:
+            text = stripped_lines.get(line_num)
+            if text is None:
+                text = stripped_lines[line_num] = lines[line_num].strip()
+            return text
         
-        lines = text_content.split('\n')
+        def matched_lines(matcher: "re.Pattern[str]", keywords: Tuple[str, ...]) -> List[Tuple[int, str]]:
+            # One C-level sweep over the whole text; each keyword is reported at most once per line
+            seen = set()
+            hits = []
+            for match in matcher.finditer(text_lower):
+                line_num = bisect_right(line_starts, match.start()) - 1
+                keyword = match.group(1)
+                if (line_num, keyword) not in seen:
+                    seen.add((line_num, keyword))
+                    hits.append((line_num, keyword))
+            
+            # Hits arrive in text order; within a line, report them in keyword-list order
+            rank = {keyword: index for index, keyword in enumerate(keywords)}
+            hits.sort(key=lambda hit: (hit[0], rank[hit[1]]))
+            return hits
         
-        for line_num, line in enumerate(lines):
-            line_lower = line.lower()
-            
-            # Check for components
-            for keyword in component_keywords:
-                if keyword in line_lower:
-                    components_found.append({
-                        "line": line_num + 1,
-                        "text": line.strip(),
-                        "type": keyword,
-                        "confidence": 0.8
-                    })
-            
-            # Check for patterns
-            for keyword in pattern_keywords:
-                if keyword in line_lower:
-                    patterns_found.append({
-                        "line": line_num + 1,
-                        "text": line.strip(),
-                        "pattern": keyword,
-                        "confidence": 0.8
-                    })
-            
-            # Check for decisions
-            for keyword in decision_keywords:
-                if keyword in line_lower:
-                    decisions_found.append({
-                        "line": line_num + 1,
-                        "text": line.strip(),
-                        "type": "architecture_decision",
-                        "confidence": 0.8
-                    })
+        # Check for components
+        for line_num, keyword in matched_lines(_COMPONENT_MATCHER, _COMPONENT_KEYWORDS):
+            components_found.append({
+                "line": line_num + 1,
+                "text": line_text(line_num),
+                "type": keyword,
+                "confidence": 0.8
+            })
+        
+        # Check for patterns
+        for line_num, keyword in matched_lines(_PATTERN_MATCHER, _PATTERN_KEYWORDS):
+            patterns_found.append({
+                "line": line_num + 1,
+                "text": line_text(line_num),
+                "pattern": keyword,
+                "confidence": 0.8
+            })
+        
+        # Check for decisions
+        for line_num, keyword in matched_lines(_DECISION_MATCHER, _DECISION_KEYWORDS):
+            decisions_found.append({
+                "line": line_num + 1,
+                "text": line_text(line_num),
+                "type": "architecture_decision",
+                "confidence": 0.8
+            })
         
         return {
             "components_found": components_found,
@@ -4,11 +4,15 @@ Ollama service for local LLM integration
 
 import asyncio
 import aiohttp
+import hashlib
 import logging
 from typing import Dict, Any, List, Optional
-from datetime import datetime
 
-from app.config import settings
+import orjson
+
+from app.cache import TTLCache
+from app.config import get_settings
+from app.models.base import utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -17,18 +21,68 @@ class OllamaService:
     """Service for interacting with Ollama local LLM"""
     
     def __init__(self):
+        settings = get_settings()
         self.base_url = settings.ollama_base_url
         self.default_model = settings.ollama_model
         self.timeout = settings.ollama_timeout
         self.temperature = settings.ollama_temperature
         self.max_tokens = settings.ollama_max_tokens
+        self.history_summary_threshold = settings.ollama_history_summary_threshold
+        self.history_keep_last = settings.ollama_history_keep_last
+        
+        # One pooled session for all calls, created on first use and closed by aclose()
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Summaries of older chat turns, keyed by a digest of the summarized messages
+        self._summary_cache = TTLCache(maxsize=256, ttl=3600.0)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it if needed"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _maybe_summarize(self, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Replace all but the most recent turns with a single summary message once history grows long"""
+        keep_last = self.history_keep_last
+        if not self.history_summary_threshold or len(messages) <= self.history_summary_threshold or keep_last <= 0:
+            return messages
+        
+        # Summarize in whole blocks of keep_last messages so the summarized prefix, and
+        # therefore its cache key, only changes every keep_last turns
+        cut = (len(messages) - keep_last) // keep_last * keep_last
+        if cut <= 0:
+            return messages
+        older = messages[:cut]
+        key = hashlib.blake2b(orjson.dumps(older), digest_size=16).digest()
+        
+        summary = self._summary_cache.get(key)
+        if summary is None:
+            transcript = "\n".join(f"{m['role']}: {m['content']}" for m in older)
+            result = await self.generate_text(prompt="Summarize briefly:\n" + transcript)
+            if not result["success"]:
+                logger.warning(f"History summarization failed, sending full history: {result['error']}")
+                return messages
+            summary = result["text"]
+            self._summary_cache.set(key, summary)
+        
+        return [{"role": "system", "content": f"Summary of the conversation so far:\n{summary}"}] + messages[cut:]
         
     async def health_check(self) -> bool:
         """Check if Ollama is running and healthy"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/api/tags", timeout=5) as response:
-                    return response.status == 200
+            session = await self._get_session()
+            async with session.get(f"{self.base_url}/api/tags", timeout=5) as response:
+                return response.status == 200
         except Exception as e:
             logger.error(f"Ollama health check failed: {e}")
             return False
@@ -36,14 +90,14 @@ class OllamaService:
     async def list_models(self) -> List[Dict[str, Any]]:
         """List available models"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/api/tags") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("models", [])
-                    else:
-                        logger.error(f"Failed to list models: {response.status}")
-                        return []
+            session = await self._get_session()
+            async with session.get(f"{self.base_url}/api/tags") as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return data.get("models", [])
+                else:
+                    logger.error(f"Failed to list models: {response.status}")
+                    return []
         except Exception as e:
             logger.error(f"Error listing models: {e}")
             return []
@@ -75,35 +129,35 @@ class OllamaService:
             if system_prompt:
                 payload["system"] = system_prompt
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload,
-                    timeout=self.timeout
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "text": data.get("response", ""),
-                            "model": model,
-                            "usage": {
-                                "prompt_tokens": data.get("prompt_eval_count", 0),
-                                "completion_tokens": data.get("eval_count", 0),
-                                "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
-                            },
-                            "finish_reason": data.get("done", True),
-                            "created_at": datetime.utcnow().isoformat()
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Ollama generation failed: {response.status} - {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"Generation failed: {response.status}",
-                            "details": error_text
-                        }
-                        
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json=payload,
+                timeout=self.timeout
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        "success": True,
+                        "text": data.get("response", ""),
+                        "model": model,
+                        "usage": {
+                            "prompt_tokens": data.get("prompt_eval_count", 0),
+                            "completion_tokens": data.get("eval_count", 0),
+                            "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
+                        },
+                        "finish_reason": data.get("done", True),
+                        "created_at": utc_now().isoformat()
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Ollama generation failed: {response.status} - {error_text}")
+                    return {
+                        "success": False,
+                        "error": f"Generation failed: {response.status}",
+                        "details": error_text
+                    }
+                    
         except Exception as e:
             logger.error(f"Error generating text with Ollama: {e}")
             return {
@@ -138,6 +192,8 @@ class OllamaService:
                 else:
                     ollama_messages.append({"role": "user", "content": content})
             
+            ollama_messages = await self._maybe_summarize(ollama_messages)
+            
             # Extract system message if present
             system_message = None
             for msg in messages:
@@ -158,38 +214,38 @@ class OllamaService:
             if system_message:
                 payload["system"] = system_message
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/chat",
-                    json=payload,
-                    timeout=self.timeout
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "message": {
-                                "role": "assistant",
-                                "content": data.get("message", {}).get("content", "")
-                            },
-                            "model": model,
-                            "usage": {
-                                "prompt_tokens": data.get("prompt_eval_count", 0),
-                                "completion_tokens": data.get("eval_count", 0),
-                                "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
-                            },
-                            "finish_reason": data.get("done", True),
-                            "created_at": datetime.utcnow().isoformat()
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Ollama chat failed: {response.status} - {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"Chat failed: {response.status}",
-                            "details": error_text
-                        }
-                        
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/chat",
+                json=payload,
+                timeout=self.timeout
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        "success": True,
+                        "message": {
+                            "role": "assistant",
+                            "content": data.get("message", {}).get("content", "")
+                        },
+                        "model": model,
+                        "usage": {
+                            "prompt_tokens": data.get("prompt_eval_count", 0),
+                            "completion_tokens": data.get("eval_count", 0),
+                            "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
+                        },
+                        "finish_reason": data.get("done", True),
+                        "created_at": utc_now().isoformat()
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Ollama chat failed: {response.status} - {error_text}")
+                    return {
+                        "success": False,
+                        "error": f"Chat failed: {response.status}",
+                        "details": error_text
+                    }
+                    
         except Exception as e:
             logger.error(f"Error with Ollama chat: {e}")
             return {
@@ -207,28 +263,28 @@ class OllamaService:
                 "prompt": text
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/embeddings",
-                    json=payload,
-                    timeout=self.timeout
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "embeddings": data.get("embedding", []),
-                            "model": model
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Ollama embedding failed: {response.status} - {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"Embedding failed: {response.status}",
-                            "details": error_text
-                        }
-                        
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/embeddings",
+                json=payload,
+                timeout=self.timeout
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        "success": True,
+                        "embeddings": data.get("embedding", []),
+                        "model": model
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Ollama embedding failed: {response.status} - {error_text}")
+                    return {
+                        "success": False,
+                        "error": f"Embedding failed: {response.status}",
+                        "details": error_text
+                    }
+                    
         except Exception as e:
             logger.error(f"Error generating embeddings with Ollama: {e}")
             return {
@@ -243,27 +299,27 @@ class OllamaService:
                 "name": model
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/pull",
-                    json=payload,
-                    timeout=300  # Longer timeout for model pulling
-                ) as response:
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "model": model,
-                            "message": "Model pulled successfully"
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Model pull failed: {response.status} - {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"Model pull failed: {response.status}",
-                            "details": error_text
-                        }
-                        
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/pull",
+                json=payload,
+                timeout=300  # Longer timeout for model pulling
+            ) as response:
+                if response.status == 200:
+                    return {
+                        "success": True,
+                        "model": model,
+                        "message": "Model pulled successfully"
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Model pull failed: {response.status} - {error_text}")
+                    return {
+                        "success": False,
+                        "error": f"Model pull failed: {response.status}",
+                        "details": error_text
+                    }
+                    
         except Exception as e:
             logger.error(f"Error pulling model: {e}")
             return {
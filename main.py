@@ -6,16 +6,16 @@ import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
-from typing import Dict, Any, Optional
-from uuid import uuid4
+from typing import Dict, Any, List, Optional
+from uuid import UUID, uuid4
 from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
-from app.config import settings
+from app.config import get_settings
 from app.agents import (
     CoreBrainAgent,
     SolutionArchitectureAgent,
@@ -28,22 +28,18 @@ from app.agents import (
     ApplicationPortfolioAgent,
     GenericAgent
 )
-from app.models.governance import GovernanceRequest, GovernanceResponse
+from app.agents.base_agent import dump_task_result
+from app.models.governance import VALIDATION_RESULT_LIST_ADAPTER, GovernanceRequest, GovernanceResponse
 from app.models.agents import AgentTask
 from app.models.architecture import (
-    ArchitectureFile, FileType, FileUploadStatus, FileUploadRequest, 
+    ArchitectureFile, ArchitectureFileContent, FileType, FileUploadStatus, FileUploadRequest, 
     FileValidationRequest, FileProcessingResult
 )
-from app.services.file_processor import file_processor
+from app.services.file_processor import file_processor, shutdown_process_pool
 from app.services.dify_service import dify_service
 from app.services.ollama_service import ollama_service
 
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Global agent instances
@@ -54,6 +50,15 @@ core_brain_agent: CoreBrainAgent = None
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
+    # Settings are parsed on startup rather than at import time
+    settings = get_settings()
+    
+    # Configure logging
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper()),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Startup
     logger.info("Starting Agentic AI Swarm...")
     
@@ -62,6 +67,9 @@ async def lifespan(app: FastAPI):
         await initialize_agents()
         logger.info("All agents initialized successfully")
         
+        # Build the OpenAPI schema now so the first docs request doesn't pay for it
+        await asyncio.to_thread(app.openapi)
+        
         yield
         
     except Exception as e:
@@ -72,6 +80,9 @@ async def lifespan(app: FastAPI):
         # Shutdown
         logger.info("Shutting down Agentic AI Swarm...")
         await shutdown_agents()
+        await dify_service.aclose()
+        await ollama_service.aclose()
+        shutdown_process_pool()
         logger.info("Shutdown complete")
 
 
@@ -137,7 +148,8 @@ app = FastAPI(
     title="Agentic AI Swarm - Architecture Governance",
     description="Autonomous AI swarm for software architecture governance and validation",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -201,7 +213,7 @@ async def list_agents():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/governance/validate")
+@app.post("/governance/validate", responses={200: {"model": GovernanceResponse}})
 async def validate_governance(
     request: GovernanceRequest,
     background_tasks: BackgroundTasks
@@ -217,19 +229,20 @@ async def validate_governance(
             agent_id=core_brain_agent.agent_id,
             task_type="governance_validation",
             priority=request.priority,
-            input_data={"governance_request": request.dict()},
+            input_data={"governance_request": request.model_dump()},
             timeout_seconds=request.timeout_seconds
         )
         
         # Process task
         result = await core_brain_agent.process_task(task)
         
-        # Convert result to GovernanceResponse
-        governance_response = GovernanceResponse(
+        # Convert result to GovernanceResponse; the validation results are checked in one
+        # batch and the rest of the core brain's output is trusted
+        governance_response = GovernanceResponse.construct_trusted(
             request_id=request.request_id,
             status=result.get("status", "completed"),
             summary=result.get("summary", "Governance validation completed"),
-            validation_results=result.get("validation_results", []),
+            validation_results=VALIDATION_RESULT_LIST_ADAPTER.validate_python(result.get("validation_results", [])),
             risk_score=result.get("risk_score", 0.0),
             compliance_score=result.get("compliance_score", 0.0),
             recommendations=result.get("recommendations", []),
@@ -238,7 +251,11 @@ async def validate_governance(
             agents_used=result.get("agents_used", [])
         )
         
-        return governance_response
+        # Serialized by pydantic-core directly rather than through jsonable_encoder
+        return Response(
+            content=governance_response.model_dump_json(),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Governance validation failed: {e}")
@@ -276,6 +293,21 @@ async def get_swarm_status():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/swarm/cache/flush")
+async def flush_swarm_cache():
+    """Flush cached specialized agent results"""
+    try:
+        if not core_brain_agent:
+            raise HTTPException(status_code=503, detail="Core brain agent not available")
+        
+        core_brain_agent.clear_result_cache()
+        return {"message": "Result cache flushed"}
+        
+    except Exception as e:
+        logger.error(f"Failed to flush result cache: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/agents/{agent_name}/task")
 async def assign_task_to_agent(agent_name: str, task_data: Dict[str, Any]):
     """Assign a task to a specific agent"""
@@ -298,12 +330,15 @@ async def assign_task_to_agent(agent_name: str, task_data: Dict[str, Any]):
         # Process task
         result = await agent.process_task(task)
         
-        return {
-            "task_id": task.task_id,
-            "agent": agent_name,
-            "status": "completed",
-            "result": result
-        }
+        return Response(
+            content=dump_task_result({
+                "task_id": task.task_id,
+                "agent": agent_name,
+                "status": "completed",
+                "result": result
+            }),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Failed to assign task to agent {agent_name}: {e}")
@@ -427,15 +462,10 @@ async def upload_architecture_file(
         # Generate file ID
         file_id = str(uuid4())
         
-        # Create upload directory
-        upload_dir = Path("uploads")
-        upload_dir.mkdir(exist_ok=True)
-        
         # Save file
-        file_path = upload_dir / f"{file_id}_{file.filename}"
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        file_path = file_processor.upload_dir / f"{file_id}_{file.filename}"
+        content = await file.read()
+        await asyncio.to_thread(file_path.write_bytes, content)
         
         # Create architecture file record
         architecture_file = ArchitectureFile(
@@ -468,6 +498,54 @@ async def upload_architecture_file(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_TEXT_CHUNK_SIZE = 64 * 1024
+
+
+def _extracted_text_path(file_id: str) -> Path:
+    """Storage path of a file's extracted text; file IDs are UUIDs, which keeps the path inside the upload directory"""
+    return file_processor.upload_dir / f"{UUID(file_id)}.txt"
+
+
+def _extracted_content_path(file_id: str) -> Path:
+    """Storage path of a file's extracted image and diagram paths, kept next to its text"""
+    return file_processor.upload_dir / f"{UUID(file_id)}.content.json"
+
+
+def _store_extracted_content(file_id: str, text: str, image_paths: List[str], diagram_paths: List[str]) -> str:
+    """Write extracted text and asset paths next to the upload and return the text's storage reference"""
+    path = _extracted_text_path(file_id)
+    path.write_text(text, encoding="utf-8")
+    
+    # The text is stored on its own and only loaded on demand, so the sidecar holds just the paths
+    content = ArchitectureFileContent(
+        file_id=file_id,
+        extracted_images=image_paths,
+        diagrams_detected=diagram_paths
+    )
+    _extracted_content_path(file_id).write_text(
+        content.model_dump_json(exclude={"extracted_text"}), encoding="utf-8"
+    )
+    return str(path)
+
+
+def _load_extracted_content(file_id: str) -> ArchitectureFileContent:
+    """Load a file's extracted content, reading the stored text on demand"""
+    content = ArchitectureFileContent.model_validate_json(
+        _extracted_content_path(file_id).read_text(encoding="utf-8")
+    )
+    text_path = _extracted_text_path(file_id)
+    if text_path.is_file():
+        content.extracted_text = text_path.read_text(encoding="utf-8")
+    return content
+
+
+def _iter_file_chunks(path: Path):
+    """Yield a file's bytes in fixed-size chunks"""
+    with open(path, "rb") as f:
+        while chunk := f.read(_TEXT_CHUNK_SIZE):
+            yield chunk
+
+
 async def process_uploaded_file(architecture_file: ArchitectureFile):
     """Process an uploaded file asynchronously"""
     try:
@@ -485,9 +563,13 @@ async def process_uploaded_file(architecture_file: ArchitectureFile):
             # Update file with processing results
             architecture_file.upload_status = FileUploadStatus.COMPLETED
             architecture_file.processing_status = "completed"
-            architecture_file.extracted_text = processing_result.text_content
-            architecture_file.extracted_images = processing_result.image_paths
-            architecture_file.diagrams_detected = processing_result.diagram_paths
+            architecture_file.extracted_text_ref = await asyncio.to_thread(
+                _store_extracted_content,
+                architecture_file.file_id,
+                processing_result.text_content or "",
+                processing_result.image_paths,
+                processing_result.diagram_paths
+            )
             architecture_file.processed_at = processing_result.processed_at
             
             # Extract architecture elements from text
@@ -537,6 +619,31 @@ async def get_architecture_file(file_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/files/{file_id}/text")
+async def get_architecture_file_text(file_id: str):
+    """Stream the extracted text of an architecture file"""
+    try:
+        path = _extracted_text_path(file_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail=f"File {file_id} not found")
+    
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail=f"Extracted text for file {file_id} not found")
+    
+    return StreamingResponse(_iter_file_chunks(path), media_type="text/plain; charset=utf-8")
+
+
+@app.get("/files/{file_id}/content")
+async def get_architecture_file_content(file_id: str):
+    """Get the extracted text, image paths and diagram paths of an architecture file"""
+    try:
+        content = await asyncio.to_thread(_load_extracted_content, file_id)
+    except (ValueError, FileNotFoundError):
+        raise HTTPException(status_code=404, detail=f"Extracted content for file {file_id} not found")
+    
+    return Response(content=content.model_dump_json(), media_type="application/json")
+
+
 @app.post("/files/{file_id}/validate")
 async def validate_architecture_file(file_id: str, request: FileValidationRequest):
     """Validate an architecture file"""
@@ -760,6 +867,8 @@ async def dify_chat(request: Dict[str, Any]):
         user_id = request.get("user_id")
         conversation_id = request.get("conversation_id")
         inputs = request.get("inputs", {})
+        static_system = request.get("static_system")
+        dynamic_context = request.get("dynamic_context")
         
         if not messages:
             raise HTTPException(status_code=400, detail="Messages are required")
@@ -769,7 +878,9 @@ async def dify_chat(request: Dict[str, Any]):
             app_id=app_id,
             user_id=user_id,
             conversation_id=conversation_id,
-            inputs=inputs
+            inputs=inputs,
+            static_system=static_system,
+            dynamic_context=dynamic_context
         )
         
         if result["success"]:
@@ -834,7 +945,7 @@ async def get_dify_conversation(conversation_id: str, app_id: Optional[str] = No
 async def global_exception_handler(request, exc):
     """Global exception handler"""
     logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "error": str(exc)}
     )
@@ -842,6 +953,7 @@ async def global_exception_handler(request, exc):
 
 if __name__ == "__main__":
     # Run the application
+    settings = get_settings()
     uvicorn.run(
         "main:app",
         host=settings.host,
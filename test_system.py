@@ -105,7 +105,7 @@ async def test_governance_validation(core_brain):
             agent_id=core_brain.agent_id,
             task_type="governance_validation",
             priority=governance_request.priority,
-            input_data={"governance_request": governance_request.dict()},
+            input_data={"governance_request": governance_request.model_dump()},
             timeout_seconds=governance_request.timeout_seconds
         )
         
@@ -0,0 +1,13 @@
+"""
+Shared pytest setup for the Agentic AI Swarm test suite
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Settings require these secrets; tests never use them for anything real
+for _name in ("SECRET_KEY", "JWT_SECRET_KEY", "ENCRYPTION_KEY"):
+    os.environ.setdefault(_name, "test")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
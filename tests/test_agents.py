@@ -0,0 +1,232 @@
+"""
+Tests for agent task queueing, template agents and the core brain's result streaming
+"""
+
+import asyncio
+from contextlib import aclosing
+from typing import Any, Dict, List
+
+import pytest
+
+from app.agents.base_agent import BaseAgent
+from app.agents.core_brain_agent import CoreBrainAgent
+from app.agents.template_agent import (
+    SPECS,
+    CostingAgent,
+    DataArchitectureAgent,
+    GenericAgent,
+    InfrastructureArchitectureAgent,
+    TemplateAgent,
+)
+from app.models.agents import AgentTask, AgentType
+from app.models.governance import VALIDATION_RESULT_LIST_ADAPTER, GovernanceRequest, GovernanceScope
+
+
+class GatedAgent(BaseAgent):
+    """Agent whose tasks block until its gate opens, recording which waiting callers were cancelled"""
+
+    def __init__(self, name: str = "Gated Agent"):
+        super().__init__(agent_type=AgentType.GENERIC, name=name, description="Test agent")
+        self.gate = asyncio.Event()
+        self.cancelled: List[str] = []
+
+    async def _initialize_agent(self) -> None:
+        pass
+
+    async def _load_configuration(self) -> None:
+        pass
+
+    async def _perform_health_check(self) -> bool:
+        return True
+
+    async def run_queued_task(self, task: AgentTask) -> Dict[str, Any]:
+        try:
+            return await super().run_queued_task(task)
+        except asyncio.CancelledError:
+            self.cancelled.append(task.task_id)
+            raise
+
+    async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
+        await self.gate.wait()
+        return {"status": "completed", "task_id": task.task_id, "agent_id": self.agent_id}
+
+    async def _cleanup(self) -> None:
+        pass
+
+
+def _task(agent: BaseAgent, task_id: str) -> AgentTask:
+    return AgentTask(task_id=task_id, agent_id=agent.agent_id, task_type="test")
+
+
+async def _start_callers(agent: BaseAgent, count: int) -> List[asyncio.Task]:
+    callers = [asyncio.create_task(agent.run_queued_task(_task(agent, f"t{i}"))) for i in range(count)]
+    # Let every caller enqueue and the worker pick up the first batch
+    await asyncio.sleep(0.01)
+    return callers
+
+
+@pytest.mark.asyncio
+async def test_queued_tasks_complete_in_order():
+    agent = GatedAgent()
+    callers = await _start_callers(agent, 3)
+    agent.gate.set()
+
+    results = await asyncio.gather(*callers)
+    assert [result["task_id"] for result in results] == ["t0", "t1", "t2"]
+    assert not agent.task_queue
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_waiting_callers():
+    agent = GatedAgent()
+    callers = await _start_callers(agent, 3)
+
+    await agent.shutdown()
+    results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), timeout=1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert not agent.task_queue
+    assert agent._queue_worker is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_worker_cancels_queued_callers():
+    agent = GatedAgent()
+    callers = await _start_callers(agent, 3)
+
+    agent._queue_worker.cancel()
+    results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), timeout=1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert not agent.task_queue
+    assert agent._queue_worker is None
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_fails_every_caller(monkeypatch):
+    agent = GatedAgent()
+
+    async def broken_batch(tasks):
+        raise RuntimeError("batch exploded")
+
+    monkeypatch.setattr(agent, "process_batch", broken_batch)
+    callers = await _start_callers(agent, 2)
+
+    results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), timeout=1)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def _release(*agents: GatedAgent) -> None:
+    """Open every gate and let the agents' queue workers finish before the loop closes"""
+    for agent in agents:
+        agent.gate.set()
+    workers = [agent._queue_worker for agent in agents if agent._queue_worker is not None]
+    await asyncio.wait_for(asyncio.gather(*workers), timeout=1)
+
+
+def _core_brain_with(agents: List[GatedAgent]) -> CoreBrainAgent:
+    brain = CoreBrainAgent()
+    brain.specialized_agents = {agent.name: agent for agent in agents}
+    return brain
+
+
+def _subtasks(agents: List[GatedAgent]) -> List[AgentTask]:
+    return [
+        AgentTask(
+            task_id=f"req_{agent.name}",
+            agent_id=agent.agent_id,
+            task_type="governance_validation",
+            input_data={"governance_request": {"scope": "security", "agent": agent.name}}
+        )
+        for agent in agents
+    ]
+
+
+@pytest.mark.asyncio
+async def test_closing_result_stream_cancels_outstanding_subtasks():
+    fast, slow_a, slow_b = GatedAgent("fast"), GatedAgent("slow_a"), GatedAgent("slow_b")
+    fast.gate.set()
+    brain = _core_brain_with([fast, slow_a, slow_b])
+
+    async with aclosing(brain._stream_results(_subtasks([fast, slow_a, slow_b]))) as results:
+        async for subtask, result in results:
+            assert subtask.agent_id == fast.agent_id
+            assert result["status"] == "completed"
+            break
+
+    assert slow_a.cancelled == ["req_slow_a"]
+    assert slow_b.cancelled == ["req_slow_b"]
+    await _release(slow_a, slow_b)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_synthesis_cancels_outstanding_subtasks():
+    fast, slow = GatedAgent("fast"), GatedAgent("slow")
+    fast.gate.set()
+    brain = _core_brain_with([fast, slow])
+    request = GovernanceRequest(request_id="req", scope=GovernanceScope.SECURITY)
+
+    synthesis = asyncio.create_task(brain._synthesize_results(request, _subtasks([fast, slow])))
+    await asyncio.sleep(0.01)
+    synthesis.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await synthesis
+    assert slow.cancelled == ["req_slow"]
+    await _release(slow)
+
+
+@pytest.mark.parametrize(
+    "agent_cls", [CostingAgent, DataArchitectureAgent, GenericAgent, InfrastructureArchitectureAgent]
+)
+@pytest.mark.asyncio
+async def test_template_agents_are_classes_bound_to_their_spec(agent_cls):
+    agent = agent_cls()
+    assert await agent.initialize()
+    assert isinstance(agent, agent_cls) and isinstance(agent, TemplateAgent)
+    assert SPECS[agent.agent_type] is agent_cls.SPEC
+    assert agent.name == agent_cls.SPEC.name
+    assert agent.config is agent_cls.SPEC.config
+
+    result = await agent.process_task(_task(agent, "t0"))
+    assert result["risk_score"] == agent_cls.SPEC.validation.risk_score
+    assert [vr["rule_id"] for vr in result["validation_results"]] == [
+        rule.rule_id for rule in agent_cls.SPEC.validation.rules
+    ]
+
+
+def test_template_agents_can_be_subclassed():
+    class TunedCostingAgent(CostingAgent):
+        pass
+
+    assert isinstance(TunedCostingAgent(), CostingAgent)
+
+
+@pytest.mark.asyncio
+async def test_static_results_get_a_fresh_id_and_timestamp_per_response():
+    agent = CostingAgent()
+    assert await agent.initialize()
+
+    first = await agent.process_task(_task(agent, "t0"))
+    second = await agent.process_task(_task(agent, "t1"))
+    first_results = VALIDATION_RESULT_LIST_ADAPTER.validate_python(first["validation_results"])
+    second_results = VALIDATION_RESULT_LIST_ADAPTER.validate_python(second["validation_results"])
+
+    assert first_results[0].id != second_results[0].id
+    assert first_results[0].created_at <= second_results[0].created_at
+    assert first_results[0].rule_id == second_results[0].rule_id
+    assert first_results[0].model_dump(exclude={"id", "created_at", "updated_at"}) == (
+        second_results[0].model_dump(exclude={"id", "created_at", "updated_at"})
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_subtasks_builds_one_task_per_target_agent():
+    first, second = GatedAgent("first"), GatedAgent("second")
+    brain = _core_brain_with([first, second])
+    request = GovernanceRequest(request_id="req", scope=GovernanceScope.SECURITY, priority="high")
+
+    subtasks = await brain._create_subtasks(request, (("first", first), ("second", second)))
+    assert all(isinstance(subtask, AgentTask) for subtask in subtasks)
+    assert [subtask.task_id for subtask in subtasks] == ["req_first", "req_second"]
+    assert [subtask.agent_id for subtask in subtasks] == [first.agent_id, second.agent_id]
+    assert all(subtask.priority == "high" for subtask in subtasks)
+    assert subtasks[0].input_data["governance_request"]["request_id"] == "req"
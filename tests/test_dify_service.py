@@ -0,0 +1,208 @@
+"""
+Tests for the Dify service's response cache, request coalescing, retries and circuit breaker,
+using a fake HTTP session
+"""
+
+import asyncio
+import copy
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from tenacity import wait_none  # noqa: E402
+
+from app.resilience import CircuitOpenError  # noqa: E402
+from app.services.dify_service import DifyService  # noqa: E402
+
+
+class FakeResponse:
+    """Response context manager; holds the body until the session's gate opens, if any"""
+
+    def __init__(self, status: int, body: Any, gate: Optional[asyncio.Event]):
+        self.status = status
+        self._body = body
+        self._gate = gate
+
+    async def __aenter__(self) -> "FakeResponse":
+        if self._gate is not None:
+            await self._gate.wait()
+        return self
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+    async def json(self, loads: Optional[Callable] = None) -> Any:
+        return copy.deepcopy(self._body)
+
+    async def text(self) -> str:
+        return str(self._body)
+
+
+class FakeSession:
+    """Stands in for aiohttp.ClientSession; handler maps each call to (status, body) or an exception"""
+
+    closed = False
+
+    def __init__(self, handler: Callable[[str, str, Dict[str, Any]], Any]):
+        self._handler = handler
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.gate: Optional[asyncio.Event] = None
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls.append((method, url, kwargs))
+        outcome = self._handler(method, url, kwargs)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        status, body = outcome
+        return FakeResponse(status, body, self.gate)
+
+
+def _service(handler: Callable[[str, str, Dict[str, Any]], Any]) -> Tuple[DifyService, FakeSession]:
+    service = DifyService()
+    session = FakeSession(handler)
+    service._session = session
+    return service, session
+
+
+def _numbered_replies() -> Callable[[str, str, Dict[str, Any]], Any]:
+    """Handler giving every call its own conversation and message IDs, as Dify does"""
+    counter = iter(range(1, 1_000_000))
+
+    def handler(method: str, url: str, kwargs: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        n = next(counter)
+        return 200, {
+            "answer": f"answer {n}",
+            "conversation_id": f"conv-{n}",
+            "id": f"msg-{n}",
+            "usage": {"total_tokens": 10},
+        }
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_completion_responses_are_cached():
+    service, session = _service(_numbered_replies())
+
+    first = await service.completion("Summarize the design", app_id="app", user_id="u1")
+    second = await service.completion("Summarize  the design", app_id="app", user_id="u1")
+    assert first["success"] and second == first
+    assert len(session.calls) == 1
+
+    await service.completion("Summarize the design", app_id="app", user_id="u2")
+    assert len(session.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_completions_are_isolated_from_caller_mutation():
+    service, _ = _service(_numbered_replies())
+
+    first = await service.completion("Summarize the design", app_id="app", user_id="u1")
+    first["usage"]["total_tokens"] = 0
+    first["text"] = "edited"
+
+    second = await service.completion("Summarize the design", app_id="app", user_id="u1")
+    assert second["usage"] == {"total_tokens": 10}
+    assert second["text"] == "answer 1"
+
+
+@pytest.mark.asyncio
+async def test_new_chats_are_not_cached():
+    service, session = _service(_numbered_replies())
+    messages = [{"role": "user", "content": "Review my architecture"}]
+
+    first = await service.chat_completion(messages, app_id="app", user_id="u1")
+    second = await service.chat_completion(messages, app_id="app", user_id="u1")
+    assert len(session.calls) == 2
+    assert first["conversation_id"] != second["conversation_id"]
+    assert first["message_id"] != second["message_id"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_completions_share_one_request():
+    service, session = _service(_numbered_replies())
+    session.gate = asyncio.Event()
+
+    callers = [
+        asyncio.create_task(service.completion("Summarize the design", app_id="app", user_id="u1"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    session.gate.set()
+    results = await asyncio.gather(*callers)
+
+    assert len(session.calls) == 1
+    assert all(result == results[0] for result in results)
+    results[0]["usage"]["total_tokens"] = 0
+    assert results[1]["usage"] == results[2]["usage"] == {"total_tokens": 10}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_new_chats_each_start_their_own_conversation():
+    service, session = _service(_numbered_replies())
+    session.gate = asyncio.Event()
+    messages = [{"role": "user", "content": "Review my architecture"}]
+
+    callers = [
+        asyncio.create_task(service.chat_completion(messages, app_id="app", user_id="u1"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    session.gate.set()
+    results = await asyncio.gather(*callers)
+
+    assert len(session.calls) == 3
+    assert len({result["conversation_id"] for result in results}) == 3
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch):
+    monkeypatch.setattr(DifyService._send.retry, "wait", wait_none())
+
+
+@pytest.mark.asyncio
+async def test_each_logical_call_retries_and_counts_one_failure(no_retry_wait):
+    service, session = _service(lambda method, url, kwargs: aiohttp.ClientConnectionError("refused"))
+
+    for call in range(1, 5):
+        result = await service.completion(f"prompt {call}", app_id="app")
+        assert not result["success"]
+        assert len(session.calls) == 3 * call
+    assert not service._breaker.is_open
+
+    await service.completion("prompt 5", app_id="app")
+    assert service._breaker.is_open
+
+    with pytest.raises(CircuitOpenError):
+        await service._request("POST", "/completion-messages")
+    result = await service.completion("prompt 6", app_id="app")
+    assert not result["success"] and "circuit is open" in result["error"]
+    assert len(session.calls) == 15
+
+
+@pytest.mark.asyncio
+async def test_server_error_response_counts_one_failure(no_retry_wait):
+    service, session = _service(lambda method, url, kwargs: (503, "unavailable"))
+
+    status, body = await service._request("POST", "/completion-messages")
+    assert status == 503 and body == "unavailable"
+    assert len(session.calls) == 3
+    assert service._breaker._failures == 1
+
+
+@pytest.mark.asyncio
+async def test_success_after_retry_resets_the_breaker(no_retry_wait):
+    outcomes = iter([
+        aiohttp.ClientConnectionError("refused"),
+        (503, "unavailable"),
+        (200, {"answer": "ok"}),
+    ])
+    service, session = _service(lambda method, url, kwargs: next(outcomes))
+    service._breaker.record_failure()
+
+    status, body = await service._request("POST", "/completion-messages")
+    assert status == 200 and body == {"answer": "ok"}
+    assert len(session.calls) == 3
+    assert service._breaker._failures == 0
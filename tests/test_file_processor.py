@@ -0,0 +1,108 @@
+"""
+Tests for the file processor's format workers, process pool and keyword extraction
+"""
+
+import asyncio
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("docx")
+pytest.importorskip("pptx")
+pytest.importorskip("PIL")
+pytest.importorskip("pytesseract")
+
+from app.models.architecture import FileType  # noqa: E402
+from app.services import file_processor as fp  # noqa: E402
+
+
+@pytest.fixture
+def process_pool():
+    pool = fp._get_process_pool()
+    yield pool
+    fp.shutdown_process_pool()
+
+
+def test_process_pool_spawns_workers(process_pool):
+    assert process_pool._mp_context.get_start_method() == "spawn"
+    assert fp._get_process_pool() is process_pool
+
+
+def test_shutdown_process_pool_allows_a_fresh_pool(process_pool):
+    fp.shutdown_process_pool()
+    assert fp._get_process_pool() is not process_pool
+
+
+@pytest.mark.asyncio
+async def test_process_file_runs_in_spawned_worker(process_pool, tmp_path):
+    svg = tmp_path / "diagram.svg"
+    svg.write_text('<svg xmlns="http://www.w3.org/2000/svg"><text>API Gateway</text></svg>', encoding="utf-8")
+
+    result = await asyncio.wait_for(
+        fp.file_processor.process_file(str(svg), FileType.SVG, "file-1"), timeout=60
+    )
+    assert result.processing_success, result.processing_errors
+    assert result.text_content == "API Gateway"
+    assert result.diagram_paths == [str(svg)]
+
+
+def _make_pdf(path, pages: int) -> None:
+    doc = fitz.open()
+    for page_num in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {page_num} service")
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.mark.parametrize("pages", [3, 20])
+def test_pdf_worker_extracts_every_page_in_order(tmp_path, pages):
+    pdf = tmp_path / "doc.pdf"
+    _make_pdf(pdf, pages)
+
+    result = fp._pdf_worker(str(pdf), "file-1", str(tmp_path))
+    page_lines = [line for line in result.text_content.splitlines() if line.startswith("Page ")]
+    assert page_lines == [f"Page {page_num} service" for page_num in range(pages)]
+    assert result.metadata["pages"] == pages
+
+
+SVG_TEXT = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<svg xmlns="http://www.w3.org/2000/svg">'
+    '<text x="1">Façade <tspan>Gateway</tspan> &amp; LB</text>'
+    '<g><text>Database</text></g>'
+    '<textPath>ignored</textPath>'
+    '</svg>'
+)
+
+
+def test_svg_worker_reads_text_and_byte_size(tmp_path):
+    svg = tmp_path / "diagram.svg"
+    svg.write_text(SVG_TEXT, encoding="utf-8")
+
+    result = fp._svg_worker(str(svg), "file-1", str(tmp_path))
+    assert result.text_content == "Façade Gateway & LB\nDatabase"
+    assert result.metadata["text_elements"] == 2
+    assert result.metadata["size"] == len(SVG_TEXT.encode("utf-8"))
+
+
+def test_svg_worker_falls_back_to_regex_for_malformed_xml(tmp_path):
+    well_formed = tmp_path / "good.svg"
+    well_formed.write_text(SVG_TEXT, encoding="utf-8")
+    malformed = tmp_path / "bad.svg"
+    malformed_text = SVG_TEXT.replace("</svg>", "<g></svg>")
+    malformed.write_text(malformed_text, encoding="utf-8")
+
+    expected = fp._svg_worker(str(well_formed), "file-1", str(tmp_path))
+    result = fp._svg_worker(str(malformed), "file-2", str(tmp_path))
+    assert result.text_content == expected.text_content
+    assert result.metadata["text_elements"] == expected.metadata["text_elements"]
+    assert result.metadata["size"] == len(malformed_text.encode("utf-8"))
+
+
+@pytest.mark.asyncio
+async def test_keywords_within_a_line_follow_keyword_list_order():
+    elements = await fp.file_processor.extract_architecture_elements(
+        "The API gateway fronts each microservice\nqueue"
+    )
+    components = [(found["line"], found["type"]) for found in elements["components_found"]]
+    assert components == [(1, "service"), (1, "api"), (1, "microservice"), (1, "gateway"), (2, "queue")]
@@ -0,0 +1,109 @@
+"""
+Tests for the data model field types and ID helpers
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.architecture import (
+    ArchitectureComponent,
+    ArchitectureDomain,
+    ComponentStatus,
+    ComponentType,
+)
+from app.models.governance import (
+    GovernanceScope,
+    ValidationResult,
+    ValidationSeverity,
+    ValidationStatus,
+)
+from app.models.base import random_bytes, sortable_uuid
+from app.models.reports import Report, ReportStatus, ReportType
+
+
+def _validation_result(severity, status) -> ValidationResult:
+    return ValidationResult(
+        rule_id="SEC_001",
+        rule_name="Encryption",
+        rule_description="Data is encrypted at rest",
+        severity=severity,
+        status=status,
+        message="ok",
+        domain=GovernanceScope.SECURITY,
+    )
+
+
+def _component(status) -> ArchitectureComponent:
+    return ArchitectureComponent(
+        component_id="web",
+        name="Web",
+        component_type=ComponentType.SERVICE,
+        domain=ArchitectureDomain.APPLICATION,
+        status=status,
+        description="Web tier",
+    )
+
+
+def _report(status) -> Report:
+    return Report(
+        title="Review",
+        report_type=ReportType.ARCHITECTURE_REVIEW,
+        status=status,
+        summary="s",
+        conclusions="c",
+        scope="solution",
+        methodology="m",
+        author="reviewer",
+    )
+
+
+@pytest.mark.parametrize("severity", list(ValidationSeverity))
+@pytest.mark.parametrize("status", list(ValidationStatus))
+def test_validation_result_accepts_enum_members(severity, status):
+    result = _validation_result(severity, status)
+    assert result.severity == severity.value
+    assert result.status == status.value
+    assert type(result.severity) is str and type(result.status) is str
+
+
+@pytest.mark.parametrize("status", list(ComponentStatus))
+def test_component_accepts_enum_members(status):
+    component = _component(status)
+    assert component.status == status.value
+    assert type(component.status) is str
+
+
+@pytest.mark.parametrize("status", list(ReportStatus))
+def test_report_accepts_enum_members(status):
+    report = _report(status)
+    assert report.status == status.value
+    assert type(report.status) is str
+
+
+def test_enum_members_and_values_build_equal_dumps():
+    from_members = _validation_result(ValidationSeverity.HIGH, ValidationStatus.FAILED)
+    from_values = _validation_result("high", "failed")
+    exclude = {"id", "created_at", "updated_at"}
+    assert from_members.model_dump(exclude=exclude) == from_values.model_dump(exclude=exclude)
+
+
+def test_unknown_values_are_rejected():
+    with pytest.raises(ValidationError):
+        _validation_result("severe", ValidationStatus.PASSED)
+    with pytest.raises(ValidationError):
+        _component("retired")
+    with pytest.raises(ValidationError):
+        _report("lost")
+
+
+def test_random_bytes_spans_buffer_refills():
+    chunks = [random_bytes(10) for _ in range(1000)]
+    assert all(len(chunk) == 10 for chunk in chunks)
+    assert len(set(chunks)) == len(chunks)
+    assert len(random_bytes(10_000)) == 10_000
+
+
+def test_sortable_uuids_are_unique_v7():
+    ids = [sortable_uuid() for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+    assert all(uid.version == 7 for uid in ids)
@@ -0,0 +1,99 @@
+"""
+Tests for the circuit breaker's state changes, using a fake clock
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app import resilience
+from app.resilience import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience, "time", SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+def _tripped(fail_max: int = 3, reset_timeout: float = 60.0) -> CircuitBreaker:
+    breaker = CircuitBreaker("test", fail_max=fail_max, reset_timeout=reset_timeout)
+    for _ in range(fail_max):
+        breaker.check()
+        breaker.record_failure()
+    return breaker
+
+
+def test_breaker_opens_after_fail_max_consecutive_failures(clock):
+    breaker = CircuitBreaker("test", fail_max=3, reset_timeout=60.0)
+    for _ in range(2):
+        breaker.record_failure()
+        breaker.check()
+    assert not breaker.is_open
+
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker("test", fail_max=3, reset_timeout=60.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.is_open
+
+
+def test_open_breaker_fails_fast_until_reset_timeout(clock):
+    breaker = _tripped()
+    clock.now += 59.0
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_half_open_allows_one_trial_call(clock):
+    breaker = _tripped()
+    clock.now += 60.0
+
+    breaker.check()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_successful_trial_closes_the_breaker(clock):
+    breaker = _tripped()
+    clock.now += 60.0
+
+    breaker.check()
+    breaker.record_success()
+    assert not breaker.is_open
+    breaker.check()
+    breaker.check()
+
+
+def test_failed_trial_reopens_for_another_reset_timeout(clock):
+    breaker = _tripped()
+    clock.now += 60.0
+
+    breaker.check()
+    clock.now += 5.0
+    breaker.record_failure()
+    assert breaker.is_open
+
+    clock.now += 59.0
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    clock.now += 1.0
+    breaker.check()